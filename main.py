@@ -5,7 +5,7 @@
  File:           main.py
  Author:         Team EL-Workbench
  Creation date:  2025-06-25
- Last modified:  2025-01-15
+ Last modified:  2026-10-16
  Version:        1.1.0
 ============================================================================
  Description:
@@ -22,6 +22,8 @@
  - 2025-01-15: Große Refaktorierung für v1.1.0. Verbesserte Code-Struktur,
                Dokumentation und studentenfreundliche Design-Muster.
                SharedState zu SharedData umbenannt, ProfileApi entfernt.
+ - 2026-10-16: SharedData um smu_apply_and_measure_batch,
+               smu_apply_and_measure_async und smu_flush_deferred_ui erweitert.
 ============================================================================
 """
 
@@ -89,6 +91,9 @@ class SharedData(QObject):
         self.smu_device = None       # Keithley SMU Geräteinstanz
         self.spectrometer_device = None # Ocean Optics Spektrometer-Instanz
         self.smu_apply_and_measure = None # High-Level SMU Messfunktion
+        self.smu_flush_deferred_ui = None # Zeigt gepufferte Sweep-Ergebnisse im SMU-Tab an
+        self.smu_apply_and_measure_batch = None # SMU-Messung für viele Sollwerte auf einmal
+        self.smu_apply_and_measure_async = None # Nicht blockierende SMU-Messung (liefert ein Future)
 
         # === LIVE MESSDATEN ===
         # Flüchtige Daten, die von Mess-Tabs aktualisiert und von Analyse-Tabs gelesen werden
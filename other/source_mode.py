@@ -0,0 +1,54 @@
+# el-workbench/other/source_mode.py
+# -*- coding: utf-8 -*-
+"""
+============================================================================
+ File:           source_mode.py
+ Author:         Team EL-Workbench
+ Creation date:  2026-10-16
+ Last modified:  2026-10-16
+ Version:        1.1.0
+============================================================================
+ Description:
+    Source-Modus (Spannung/Strom) der SMU-High-Level-API. Liegt außerhalb
+    der Tabs, damit aufrufende Tabs (z.B. der Sweep-Tab) ihn verwenden
+    können, ohne das SMU-Tab-Modul zu importieren (Regel 2.3).
+============================================================================
+ Change Log:
+ - 2026-10-16: SourceMode aus tabs/smu_tab.py hierher verschoben; Alias für
+               den früheren Parameter is_voltage_source ergänzt.
+============================================================================
+"""
+import functools
+import warnings
+from enum import IntEnum
+
+
+class SourceMode(IntEnum):
+    """
+    Source-Modus für die High-Level-API (shared_data.smu_apply_and_measure & Co.).
+    Die Werte entsprechen dem früheren Parameter is_voltage_source (False/True),
+    sodass Aufrufer, die noch einen bool übergeben, weiterhin funktionieren.
+    """
+    CURRENT = 0
+    VOLTAGE = 1
+
+
+def accepts_is_voltage_source(method):
+    """
+    Decorator für API-Methoden mit dem Parameter 'mode': Nimmt zusätzlich den
+    früheren Schlüsselwort-Parameter is_voltage_source an (veraltet, löst eine
+    DeprecationWarning aus) und übergibt ihn als SourceMode.
+
+    Raises:
+        TypeError: Wenn mode und is_voltage_source gleichzeitig übergeben werden.
+    """
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        if 'is_voltage_source' in kwargs:
+            if 'mode' in kwargs:
+                raise TypeError(f"{method.__name__}(): mode und is_voltage_source nicht gleichzeitig angeben.")
+            warnings.warn("is_voltage_source ist veraltet, bitte mode=SourceMode.VOLTAGE/CURRENT verwenden.",
+                          DeprecationWarning, stacklevel=2)
+            kwargs['mode'] = SourceMode(bool(kwargs.pop('is_voltage_source')))
+        return method(*args, **kwargs)
+    return wrapper
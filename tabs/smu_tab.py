@@ -6,7 +6,7 @@
  File:          smu_tab.py
  Author:        Silas Hörz
  Creation date: 2025-07-04
- Last modified: 2025-07-25 (Adapted to new API-centric design rules)
+ Last modified: 2026-10-16
  Version:       2.0.0
 ============================================================================
  Description:
@@ -14,23 +14,57 @@
      (SMU) innerhalb des EL-Workbench. Verantwortlich für UI, die
      Instanziierung des SMU-Treibers und die Bereitstellung einer
      High-Level-API für andere Module.
+============================================================================
+ Change Log:
+ - 2025-07-25: An die API-zentrierten Design-Regeln angepasst.
+ - 2026-10-16: Performance-Überarbeitung von Treiber und Tab:
+               - Serielle I/O in einem eigenen QThread; neue API-Methoden
+                 apply_and_measure_async (Future) und apply_and_measure_batch
+                 (Schleife auf dem Gerät, Dummy vektorisiert).
+               - Setzen-Messen-Zyklus als ein TSP-Schreibzugriff mit
+                 waitcomplete()/delay(); unveränderte Einstellungen werden
+                 nicht erneut gesendet, Wiederholung bei verlorener Antwort.
+               - Verbindungsaufbau per *IDN?-Bereitschaftsschleife,
+                 Low-Latency-Modus für USB-Seriell-Adapter, wählbare
+                 Geräte-Baudrate und optionaler Baudratenwechsel.
+               - Getrennte Lese-Timeouts für kurze Abfragen und Messungen,
+                 Schreib-Timeout, vorkodierte TSP-Befehle.
+               - Serielles Log über logging/QueueListener, gepuffert und
+                 begrenzt; Kanal-UI nur im GUI-Thread und mit einem Repaint.
+               - COM-Port-Suche im Hintergrund, neu nur bei An-/Abstecken.
+               - Log-Meldungen des Treibers auf Deutsch.
+ - 2026-10-16: High-Level-API nimmt den Source-Modus als SourceMode
+               (other/source_mode.py); is_voltage_source bleibt als
+               veralteter Schlüsselwort-Alias erhalten.
 ============================================================================
 """
+import os
 import sys
+import math
 import time
+import collections
+import logging
+import logging.handlers
+import queue
+import threading
+from dataclasses import dataclass
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 import serial
 import numpy
-from serial.tools import list_ports
-from datetime import datetime
 
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QGroupBox, QLabel,
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QGroupBox, QLabel,
     QLineEdit, QPushButton, QComboBox, QRadioButton, QMessageBox, QSplitter,
-    QButtonGroup, QTextEdit, QSizePolicy, QCheckBox, QScrollBar
+    QButtonGroup, QPlainTextEdit, QSizePolicy, QCheckBox, QScrollBar
+)
+from PyQt6.QtCore import (
+    Qt, QTimer, QThread, pyqtSignal, pyqtSlot, QObject, QSignalBlocker,
+    QCoreApplication, QAbstractNativeEventFilter, QFileSystemWatcher
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QObject
 from PyQt6.QtGui import QDoubleValidator, QFont, QPalette, QColor
 
+from other.source_mode import SourceMode, accepts_is_voltage_source
+
 # Konstanten für die TSP-Befehle (Keithley specific)
 TSP_SMU_OFF = 'OUTPUT_OFF'
 TSP_SMU_ON = 'OUTPUT_ON'
@@ -38,6 +72,337 @@ TSP_DC_VOLTS = 'OUTPUT_DCVOLTS'
 TSP_DC_AMPS = 'OUTPUT_DCAMPS'
 TSP_SENSE_LOCAL = 'SENSE_LOCAL'
 TSP_SENSE_REMOTE = 'SENSE_REMOTE'
+# Zeilenende für TSP über RS-232: ein einzelnes LF. Das Gerät beendet auch seine
+# Antworten mit LF; ein CR würde nur als zusätzliches Leerzeichen gelesen.
+TSP_EOL = '\n'
+_TSP_EOL_BYTES = TSP_EOL.encode('ascii')
+
+# Fehler, nach denen die Verbindung als verloren gilt; SerialException umfasst auch
+# SerialTimeoutException (Schreib-Timeout, z.B. hängender Adapter)
+CONNECTION_ERRORS = (ConnectionError, serial.SerialException)
+
+
+# Source-Modus -> TSP-Source-Funktion
+SOURCE_FUNCS = {SourceMode.VOLTAGE: TSP_DC_VOLTS, SourceMode.CURRENT: TSP_DC_AMPS}
+
+# Standard-Wartezeit zwischen Einschalten und Messen (s, per delay() auf dem Gerät).
+# Entspricht der bisherigen festen Pause; Aufrufer mit schnellen Prüflingen können
+# eine kürzere settle_time (auch 0) übergeben.
+DEFAULT_SETTLE_TIME_S = 0.1
+
+# Maximale Zeilenzahl im seriellen Log; ältere Zeilen werden automatisch verworfen
+SERIAL_LOG_MAX_BLOCKS = 5000
+# Intervall, in dem gepufferte Log-Zeilen gesammelt in das Widget geschrieben werden
+SERIAL_LOG_FLUSH_MS = 50
+
+# Wiederholungen eines Setzen-Messen-Zyklus bei fehlender/ungültiger Antwort,
+# Wartezeit vor dem n-ten Versuch: APPLY_RETRY_BACKOFF_S * 2**n
+APPLY_RETRIES = 1
+APPLY_RETRY_BACKOFF_S = 0.05
+
+# Startgröße der Puffer für zurückgestellte UI-Updates (wird bei Bedarf verdoppelt)
+SWEEP_BUFFER_INITIAL_SIZE = 4096
+SMU_CHANNELS = ('a', 'b')
+
+# Höchstens so viele Sollwerte pro TSP-Schleife in apply_and_measure_batch
+BATCH_LEVELS_PER_SCRIPT = 100
+# Obergrenze für die Länge der Schleifenzeile (Zeichen). Längere Zeilen kann das Gerät
+# je nach Firmware nicht annehmen; der Block wird dann verkleinert (konservativer Wert).
+TSP_MAX_LINE_LENGTH = 1024
+
+# Höchstens so lange wartet _call_io auf einen Auftrag im I/O-Thread (inkl. Warteschlange);
+# bei apply_and_measure_batch kommt der Mess-Timeout (SMU_MEASURE_TIMEOUT_S + settle_time) pro Sollwert hinzu
+IO_CALL_TIMEOUT_S = 30.0
+
+# Relative Änderung, ab der ein Messwert-Label neu gezeichnet wird (Anzeige hat 5 signifikante Stellen)
+READING_REL_TOLERANCE = 1e-4
+# Vorgebundene Formatierer für die Messwert-Labels (kein f-String-Parsing pro Aufruf)
+_FMT_I = "{:.4e} A".format
+_FMT_V = "{:.4e} V".format
+
+# Bereitschaftsprüfung beim Verbinden: *IDN? wird bis zu CONNECT_IDN_RETRIES-mal
+# gesendet, bis das Gerät antwortet. Ein bereites Gerät antwortet nach wenigen ms;
+# ein startendes Gerät oder ein langsamer Adapter bekommt insgesamt
+# CONNECT_IDN_RETRIES * CONNECT_IDN_TIMEOUT_S = 2 s (wie die frühere feste Wartezeit)
+CONNECT_IDN_TIMEOUT_S = 0.2
+# Lese-Timeout für kurze Abfragen (s). TSP-Antworten kommen nach wenigen ms; ein
+# abgeschaltetes Gerät fällt so schnell auf.
+SMU_READ_TIMEOUT_S = 0.2
+# Lese-Timeout für Messantworten (s): Integrationszeit (NPLC), Autorange und Filter
+# können eine Messung deutlich über SMU_READ_TIMEOUT_S verlängern. Geräteseitige
+# delay()-Zeiten (settle_time) werden zusätzlich gewährt.
+SMU_MEASURE_TIMEOUT_S = 2.0
+CONNECT_IDN_RETRIES = 10
+# Wird mit jeder *IDN?-Abfrage im selben Schreibzugriff gesendet: keine "TSP>"-Prompts
+# und keine automatisch ausgegebenen Fehlermeldungen, damit jede gelesene Zeile
+# eine Antwort auf eine eigene Abfrage ist
+CONNECT_SETUP_LINES = ("localnode.prompts = 0", "localnode.showerrors = 0")
+
+# Vom 2602 unterstützte Baudraten (höchstens 115200). Verbunden wird mit der im UI
+# gewählten Geräte-Baudrate (vorbelegt: SMU_DEFAULT_BAUDRATE); antwortet das Gerät dort
+# nicht, werden die übrigen Raten probiert (serial.baud speichert das Gerät dauerhaft).
+# Ein Wechsel auf eine andere Rate per serial.baud erfolgt nur auf Wunsch.
+SMU_DEFAULT_BAUDRATE = 115200
+SMU_BAUDRATES = (9600, 19200, 38400, 57600, 115200)
+
+# Innerhalb dieser Zeit wird die COM-Port-Liste beim Öffnen der Combobox nicht neu abgefragt
+PORT_SCAN_CACHE_S = 1.0
+# Ereignisse beim Ein-/Ausstecken innerhalb dieser Zeit zu einer Port-Suche zusammenfassen
+PORT_WATCH_DEBOUNCE_MS = 300
+DUMMY_PORT = "COM_DUMMY"
+
+
+class _SerialLogFormatter(logging.Formatter):
+    """
+    Formatter für das serielle Log ("[HH:MM:SS.mmm] Meldung"). Der Sekundenanteil
+    wird nur einmal pro Sekunde per strftime erzeugt; bei vielen Zeilen pro
+    Sekunde (Sweeps) kommen die Zeilen mit dem zwischengespeicherten Text aus.
+    """
+    def __init__(self):
+        super().__init__("[%(asctime)s.%(msecs)03d] %(message)s")
+        self._cached_second = None
+        self._cached_text = ""
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_second = second
+            self._cached_text = time.strftime("%H:%M:%S", time.localtime(second))
+        return self._cached_text
+
+
+class _SignalLogHandler(logging.Handler):
+    """
+    Logging-Handler, der formatierte Zeilen über ein Qt-Signal weitergibt.
+    Läuft im Thread des QueueListener; das Signal stellt die Zeile per
+    QueuedConnection im GUI-Thread zu.
+    """
+    def __init__(self, signal):
+        super().__init__()
+        self._signal = signal
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            self._signal.emit(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+
+class _PortScanWorker(QObject):
+    """
+    Fragt die verfügbaren COM-Ports in einem eigenen Thread ab.
+    list_ports.comports() kann unter Windows (WMI) mehrere hundert ms dauern
+    und würde sonst die GUI beim Öffnen der Combobox blockieren.
+    """
+    finished = pyqtSignal(list) # Liste der Gerätenamen, z.B. ["COM3", "COM4"]
+
+    def run(self):
+        # Erst hier importieren: list_ports zieht plattformabhängige Module
+        # (unter Windows ctypes/SetupAPI) nach, die beim Programmstart nicht gebraucht werden
+        from serial.tools import list_ports
+        try:
+            ports = [port.device for port in list_ports.comports()]
+        except Exception:
+            ports = [] # Lieber eine leere Liste als ein hängender Thread
+        self.finished.emit(ports)
+
+
+# Vorgefertigte TSP-Vorlagen je (Kanal, Source-Funktion): Die Befehlsnamen
+# (levelv/limiti bzw. leveli/limitv) werden einmal beim Import festgelegt,
+# pro Aufruf wird nur noch der Zahlenwert per %-Formatierung eingesetzt.
+_SOURCE_TEMPLATES = {
+    (ch, func): {
+        'func': f"smu{ch}.source.func = smu{ch}.{func}",
+        'level': f"smu{ch}.source.{'levelv' if func == TSP_DC_VOLTS else 'leveli'} = %.9g",
+        'limit': f"smu{ch}.source.{'limiti' if func == TSP_DC_VOLTS else 'limitv'} = %.9g",
+    }
+    for ch in ('a', 'b') for func in (TSP_DC_VOLTS, TSP_DC_AMPS)
+}
+
+# Feste Befehle ohne Zahlenwert je Kanal, ebenfalls einmal beim Import erzeugt
+_CHANNEL_COMMANDS = {
+    ch: {
+        'reset': f"smu{ch}.reset()",
+        'measure_iv': f"print(smu{ch}.measure.iv())",
+        'output': {state: f"smu{ch}.source.output = smu{ch}.{state}" for state in (TSP_SMU_ON, TSP_SMU_OFF)},
+        'sense': {mode: f"smu{ch}.sense = smu{ch}.{mode}" for mode in (TSP_SENSE_LOCAL, TSP_SENSE_REMOTE)},
+        # Schlüssel (Teil vor " = ") für den Einstellungs-Cache des Treibers
+        'prefix': f"smu{ch}.",
+        'output_key': f"smu{ch}.source.output",
+        'func_key': f"smu{ch}.source.func",
+    }
+    for ch in ('a', 'b')
+}
+
+# Bereits kodierte Sendedaten (inkl. Zeilenende) der festen Befehle: send_command
+# schreibt diese direkt, ohne pro Aufruf zu kodieren (z.B. print(smuX.measure.iv()))
+_ENCODED_COMMANDS = {
+    command: command.encode('ascii') + _TSP_EOL_BYTES
+    for commands in _CHANNEL_COMMANDS.values()
+    for command in (commands['reset'], commands['measure_iv'],
+                    *commands['output'].values(), *commands['sense'].values())
+}
+_ENCODED_COMMANDS["waitcomplete()"] = b"waitcomplete()" + _TSP_EOL_BYTES
+
+
+def _run_io_job(job):
+    """
+    Führt einen Auftrag (Future, Funktion, Argumente) aus und legt das Ergebnis
+    oder die Exception im Future ab. Abgebrochene Aufträge werden übersprungen.
+    """
+    future, fn, args = job
+    if not future.set_running_or_notify_cancel():
+        return
+    try:
+        future.set_result(fn(*args))
+    except Exception as e:
+        future.set_exception(e)
+
+
+class _SmuIoWorker(QObject):
+    """
+    Führt Treiberaufrufe im I/O-Thread des SMU-Tabs aus (siehe _run_io_job).
+    Da nur dieser eine Thread auf den seriellen Port zugreift, kommen sich GUI
+    und Sweep-Worker nicht mehr in die Quere.
+    """
+    @pyqtSlot(object)
+    def run_job(self, job):
+        _run_io_job(job)
+
+
+class _DeviceChangeFilter(QAbstractNativeEventFilter):
+    """Windows: ruft 'callback' auf, wenn ein Gerät (z.B. USB-Seriell-Adapter) an- oder abgesteckt wird."""
+    WM_DEVICECHANGE = 0x0219
+    DBT_DEVICEARRIVAL = 0x8000
+    DBT_DEVICEREMOVECOMPLETE = 0x8004
+
+    def __init__(self, callback):
+        super().__init__()
+        self._callback = callback
+
+    def nativeEventFilter(self, event_type, message):
+        if event_type == b"windows_generic_MSG":
+            import ctypes.wintypes # Nur unter Windows verfügbar
+            msg = ctypes.wintypes.MSG.from_address(int(message))
+            if msg.message == self.WM_DEVICECHANGE and msg.wParam in (self.DBT_DEVICEARRIVAL,
+                                                                       self.DBT_DEVICEREMOVECOMPLETE):
+                self._callback()
+        return False, 0
+
+
+class _PortWatcher(QObject):
+    """
+    Meldet das An- und Abstecken serieller Geräte, damit die Port-Liste nur bei
+    Änderungen neu abgefragt werden muss:
+    - Windows: WM_DEVICECHANGE über einen nativen Event-Filter
+    - Linux/macOS: QFileSystemWatcher auf /dev (dort entstehen/verschwinden ttyUSB0 usw.)
+    Ist keine Überwachung möglich, bleibt 'active' False und die Port-Liste wird
+    wie bisher höchstens alle PORT_SCAN_CACHE_S Sekunden neu abgefragt.
+    """
+    ports_changed = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.active = False
+        # Mehrere Ereignisse kurz hintereinander (udev legt z.B. noch Symlinks an) zusammenfassen
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(PORT_WATCH_DEBOUNCE_MS)
+        self._debounce_timer.timeout.connect(self.ports_changed)
+
+        if sys.platform.startswith('win'):
+            app = QCoreApplication.instance()
+            if app is not None:
+                self._native_filter = _DeviceChangeFilter(self._debounce_timer.start)
+                app.installNativeEventFilter(self._native_filter)
+                self.active = True
+        elif os.path.isdir('/dev'):
+            self._fs_watcher = QFileSystemWatcher(['/dev'], self)
+            self._fs_watcher.directoryChanged.connect(lambda _path: self._debounce_timer.start())
+            self.active = bool(self._fs_watcher.directories())
+
+
+def build_source_settings_script(channel: str, func: str, level: float, limit: float,
+                                  sense_mode: str | None = None) -> list[str]:
+    """
+    Erstellt die TSP-Zeilen zum Einstellen von Sense-Modus, Source-Funktion,
+    Level und Limit eines Kanals (zum gemeinsamen Senden per send_script).
+
+    Args:
+        channel: Kanal ('a' oder 'b').
+        func: Source-Funktion (TSP_DC_VOLTS oder TSP_DC_AMPS).
+        level: Source-Level in V bzw. A.
+        limit: Compliance-Limit in A bzw. V.
+        sense_mode: TSP_SENSE_LOCAL/TSP_SENSE_REMOTE oder None (unverändert lassen).
+
+    Returns:
+        list[str]: TSP-Befehle ohne Antwort.
+    """
+    templates = _SOURCE_TEMPLATES[(channel, func)]
+    lines = [_CHANNEL_COMMANDS[channel]['sense'][sense_mode]] if sense_mode else []
+    lines += [
+        templates['func'],
+        templates['level'] % level,
+        templates['limit'] % limit,
+    ]
+    return lines
+
+
+def build_apply_measure_script(channel: str, func: str, level: float, limit: float,
+                               settle_time: float = DEFAULT_SETTLE_TIME_S, sense_mode: str | None = None) -> list[str]:
+    """
+    Erstellt die TSP-Zeilen für einen kompletten Setzen-Messen-Zyklus eines Kanals.
+
+    Die Zeilen werden vom Treiber in einem einzigen Schreibzugriff gesendet, sodass
+    statt fünf Einzelbefehlen nur ein Schreib- und ein Lesezugriff nötig sind.
+
+    Args:
+        channel: Kanal ('a' oder 'b').
+        func: Source-Funktion (TSP_DC_VOLTS oder TSP_DC_AMPS).
+        level: Source-Level in V bzw. A.
+        limit: Compliance-Limit in A bzw. V.
+        settle_time: Zusätzliche Wartezeit in s nach waitcomplete() (auf dem Gerät).
+                     Standard DEFAULT_SETTLE_TIME_S; mit 0 wird gemessen, sobald das Gerät bereit ist.
+        sense_mode: TSP_SENSE_LOCAL/TSP_SENSE_REMOTE oder None (unverändert lassen).
+
+    Returns:
+        list[str]: TSP-Befehle; genau eine Zeile (print) erzeugt eine Antwort.
+    """
+    commands = _CHANNEL_COMMANDS[channel]
+    lines = build_source_settings_script(channel, func, level, limit, sense_mode)
+    lines += [
+        commands['output'][TSP_SMU_ON],
+        "waitcomplete()",
+    ]
+    if settle_time > 0:
+        lines.append(f"delay({settle_time})")
+    lines.append(commands['measure_iv'])
+    lines.append(commands['output'][TSP_SMU_OFF])
+    return lines
+
+
+def build_batch_measure_script(channel: str, func: str, levels, limit: float,
+                               settle_time: float = DEFAULT_SETTLE_TIME_S) -> list[str]:
+    """
+    Erstellt die TSP-Zeilen für Setzen-Messen-Zyklen über mehrere Sollwerte.
+
+    Die Sollwerte stehen als Tabelle in einer einzigen Zeile mit einer Schleife,
+    die auf dem Gerät läuft (eine Zeile, da lokale Variablen im Direktmodus nur
+    innerhalb einer Zeile gültig sind). Jeder Durchlauf entspricht einem
+    build_apply_measure_script-Zyklus und gibt eine Zeile "I<TAB>V" aus.
+
+    Returns:
+        list[str]: TSP-Befehle; die Schleife erzeugt len(levels) Antwortzeilen.
+    """
+    templates = _SOURCE_TEMPLATES[(channel, func)]
+    level_attr = templates['level'].partition(" = ")[0] # z.B. "smua.source.levelv"
+    values = ",".join("%.9g" % level for level in levels)
+    delay = f" delay({settle_time})" if settle_time > 0 else ""
+    loop = (f"do local lv = {{{values}}} for k = 1, #lv do {level_attr} = lv[k]"
+            f" smu{channel}.source.output = smu{channel}.{TSP_SMU_ON} waitcomplete(){delay}"
+            f" print(smu{channel}.measure.iv())"
+            f" smu{channel}.source.output = smu{channel}.{TSP_SMU_OFF} end end")
+    return [templates['func'], templates['limit'] % limit, loop]
 
 
 class Keithley2602(QObject):
@@ -52,99 +417,478 @@ class Keithley2602(QObject):
     def __init__(self):
         super().__init__()
         self._ser = serial.Serial() # Use _ser for internal serial object
-        self._ser.timeout = 2
+        self._ser.timeout = SMU_READ_TIMEOUT_S
+        # Schreibzugriffe begrenzen: Hängt der Adapter, kommt eine SerialTimeoutException
+        # statt eines blockierten Threads (ohne Flusskontrolle sonst nie erreicht)
+        self._ser.write_timeout = 1.0
+        # Optionale Pause nach jedem Schreibzugriff (s). Standard 0: TSP-Befehle werden
+        # vom Gerät gepuffert abgearbeitet, Antworten werden per readline() abgewartet.
+        # Nur für Geräte/Adapter erhöhen, die ohne Pause Befehle verlieren.
+        self._post_write_delay = 0.0
+        # Wiederverwendeter Sendepuffer: Befehle werden hier hinein kodiert, statt
+        # pro Befehl einen verketteten String und ein neues bytes-Objekt anzulegen
+        self._tx_buf = bytearray()
+        self._initial_baudrate = SMU_DEFAULT_BAUDRATE # Baudrate beim Verbindungsaufbau
+        # Verbindungsstatus als einfacher bool (nur connect/_close_port ändern ihn);
+        # die Prüfung vor jedem Befehl kommt so ohne pyserial-Property aus
+        self._opened = False
+        # Zuletzt gesendete Einstellungszeilen pro Kanal ("smua.source.levelv" -> ganze Zeile).
+        # apply_and_measure_atomic lässt unveränderte Zeilen weg.
+        self._settings_cache: dict[str, dict[str, str]] = {}
 
     @property
     def is_open(self) -> bool:
         """Gibt den Verbindungsstatus des seriellen Ports zurück."""
-        return self._ser.is_open
+        return self._opened
 
-    def connect(self, port: str, baudrate: int = 115200) -> tuple[bool, str]:
-        """Versucht, eine Verbindung zum Keithley SMU herzustellen."""
-        if self._ser.is_open:
+    def connect(self, port: str, baudrate: int = SMU_DEFAULT_BAUDRATE, low_latency: bool = True,
+                latency_timer_ms: int = 1, preferred_baudrate: int | None = None,
+                write_windows_latency_timer: bool = False) -> tuple[bool, str]:
+        """
+        Versucht, eine Verbindung zum Keithley SMU herzustellen.
+
+        Args:
+            port: Name des seriellen Ports (z.B. "COM3" oder "/dev/ttyUSB0").
+            baudrate: Aktuell am Gerät eingestellte Baudrate der RS-232-Verbindung.
+            low_latency: Low-Latency-Modus des USB-Seriell-Adapters aktivieren
+                         (abschaltbar, falls ein Adapter damit Probleme macht).
+            latency_timer_ms: Latenz-Timer für FTDI-Adapter unter Linux (Standard des Treibers: 16 ms).
+                              Unter Windows wird nur geprüft, ob die Registry einen höheren Wert enthält.
+            preferred_baudrate: Nach dem Verbindungsaufbau auf diese Baudrate wechseln
+                                (None = bei 'baudrate' bleiben). Schlägt der Wechsel fehl,
+                                bleibt die Verbindung mit 'baudrate' bestehen.
+            write_windows_latency_timer: Unter Windows den Latenz-Timer in der Registry
+                                         dauerhaft setzen (benötigt Administratorrechte,
+                                         gilt für alle Programme und erst nach erneutem
+                                         Einstecken des Adapters).
+        """
+        if self._opened:
             self.disconnect() # Ensure previous connection is closed
         try:
             self._ser.port = port
             self._ser.baudrate = baudrate
+            # Keine Handshake-Leitungen/Software-Flusskontrolle: Der 2602 nutzt sie
+            # standardmäßig nicht, XON/XOFF würde Bytes in Antworten verschlucken.
+            # pyserial öffnet den Port unter POSIX bereits im Raw-Modus (ohne
+            # ICANON/ECHO/OPOST/ICRNL), eine zusätzliche termios-Konfiguration ist nicht nötig.
+            self._ser.rtscts = False
+            self._ser.xonxoff = False
+            self._ser.dsrdtr = False
             self._ser.open()
-            time.sleep(0.1)
-            self._ser.read_all() # Clear buffer
-            self.data_sent.emit(f"Connecting to {port}...")
-
-            # Query IDN and set display functions upon successful connection
-            idn_response = self.query("*IDN?") # Use query for IDN
-            self.send_command("display.smua.measure.func = display.MEASURE_DCAMPS") # Current on Display A
-            self.send_command("display.smub.measure.func = display.MEASURE_DCVOLTS") # Voltage on Display B
+            self._opened = True
+            self._settings_cache.clear() # Gerätezustand unbekannt
+            if low_latency:
+                self._enable_low_latency(port, latency_timer_ms, write_windows_latency_timer)
+            self.data_sent.emit(f"Verbinde mit {port}...")
+
+            idn_response = self._wait_until_ready()
+            if not idn_response:
+                idn_response, baudrate = self._probe_baudrates(baudrate)
+            if not idn_response:
+                self._close_port()
+                self.data_sent.emit("Verbindung fehlgeschlagen: keine Antwort auf *IDN?")
+                return False, "Verbindungsfehler: Gerät antwortet nicht auf *IDN?"
+
+            self._initial_baudrate = baudrate
+            if preferred_baudrate and preferred_baudrate != baudrate:
+                if not self._switch_baudrate(preferred_baudrate) and not self._wait_until_ready():
+                    # Auch auf der bisherigen Rate keine Antwort mehr: Verbindung nicht verwendbar
+                    self._close_port()
+                    self.data_sent.emit("Verbindung fehlgeschlagen: keine Antwort nach dem Baudratenwechsel")
+                    return False, "Verbindungsfehler: Gerät antwortet nach dem Baudratenwechsel nicht mehr."
+
+            # Set display functions upon successful connection (one write for both displays)
+            self.send_script([
+                "display.smua.measure.func = display.MEASURE_DCAMPS",  # Current on Display A
+                "display.smub.measure.func = display.MEASURE_DCVOLTS", # Voltage on Display B
+            ])
 
             return True, idn_response.strip()
         except serial.SerialException as e:
-            self.data_sent.emit(f"Connection failed: {e}")
+            self._close_port()
+            self.data_sent.emit(f"Verbindung fehlgeschlagen: {e}")
             return False, f"Verbindungsfehler: {e}"
         except Exception as e:
-            self.data_sent.emit(f"Unexpected error during connection: {e}")
+            self._close_port()
+            self.data_sent.emit(f"Unerwarteter Fehler beim Verbinden: {e}")
             return False, f"Unerwarteter Fehler: {e}"
 
+    def _wait_until_ready(self, retries: int = CONNECT_IDN_RETRIES) -> str:
+        """
+        Fragt *IDN? ab, bis das Gerät antwortet, statt pauschal zu warten: Ein
+        bereites Gerät antwortet nach wenigen ms, ein gerade startendes bekommt
+        bis zu CONNECT_IDN_RETRIES Versuche (insgesamt 2 s). Prompts und
+        Fehlerausgaben werden im selben Schreibzugriff abgeschaltet (CONNECT_SETUP_LINES).
+
+        Args:
+            retries: Anzahl der *IDN?-Versuche.
+
+        Returns:
+            str: IDN-Antwort oder "" wenn das Gerät nicht geantwortet hat.
+        """
+        # Nur vor dem ersten Versuch leeren (Reste früherer Sitzungen, auch Prompts):
+        # eine verspätete Antwort eines früheren Versuchs wird so ebenfalls angenommen
+        self._ser.reset_input_buffer()
+        for attempt in range(retries):
+            self.send_script([*CONNECT_SETUP_LINES, "*IDN?"])
+            response = self.read_response(timeout=CONNECT_IDN_TIMEOUT_S)
+            if response:
+                if attempt:
+                    # Antworten auf die übrigen Versuche abwarten und verwerfen
+                    time.sleep(CONNECT_IDN_TIMEOUT_S)
+                    self._ser.reset_input_buffer()
+                return response
+        return ""
+
+    def _probe_baudrates(self, tried_baudrate: int) -> tuple[str, int]:
+        """
+        Sucht das Gerät auf den übrigen Raten aus SMU_BAUDRATES (je ein *IDN?-Versuch).
+        Das Gerät speichert serial.baud dauerhaft: Endet eine Sitzung ohne disconnect()
+        (Absturz, Kabel gezogen), steht es beim nächsten Verbinden noch auf der
+        ausgehandelten Rate.
+
+        Returns:
+            tuple[str, int]: (IDN-Antwort, Baudrate) oder ("", tried_baudrate), wenn keine Rate antwortet.
+        """
+        for baudrate in sorted(SMU_BAUDRATES, reverse=True):
+            if baudrate == tried_baudrate:
+                continue
+            self._ser.baudrate = baudrate
+            response = self._wait_until_ready(retries=1)
+            if response:
+                self.data_sent.emit(f"Gerät antwortet mit {baudrate} Baud.")
+                return response, baudrate
+        self._ser.baudrate = tried_baudrate
+        return "", tried_baudrate
+
+    def _switch_baudrate(self, baudrate: int) -> bool:
+        """
+        Stellt Gerät und Port auf eine neue Baudrate um und prüft sie per *IDN?.
+        Antwortet das Gerät nicht, wird der Port auf die bisherige Baudrate
+        zurückgeschaltet (z.B. wenn das Gerät die Rate nicht unterstützt und den
+        Befehl ablehnt); ob das Gerät dort antwortet, prüft der Aufrufer.
+
+        Returns:
+            bool: True, wenn die neue Baudrate aktiv ist.
+        """
+        old_baudrate = self._ser.baudrate
+        self.send_command(f"serial.baud = {baudrate}")
+        self._ser.flush() # Befehl muss mit der alten Rate vollständig gesendet sein
+        self._ser.baudrate = baudrate # pyserial konfiguriert den offenen Port direkt um
+        if self._wait_until_ready():
+            self.data_sent.emit(f"Baudrate auf {baudrate} gewechselt.")
+            return True
+
+        self._ser.baudrate = old_baudrate
+        self.data_sent.emit(f"Baudrate {baudrate} nicht übernommen, zurück auf {old_baudrate}.")
+        return False
+
+    def _enable_low_latency(self, port: str, latency_timer_ms: int, write_windows_latency_timer: bool = False):
+        """
+        Verkürzt die Pufferzeit von USB-Seriell-Adaptern (FTDI/CH340), die Bytes
+        sonst bis zu 16 ms sammeln, bevor sie weitergegeben werden. Fehler werden
+        nur protokolliert, die Verbindung funktioniert auch ohne diese Optimierung.
+        Unter Windows wird die Registry nur mit write_windows_latency_timer=True geändert.
+        """
+        if hasattr(self._ser, 'set_low_latency_mode'): # Nur unter Linux in pyserial vorhanden
+            try:
+                self._ser.set_low_latency_mode(True)
+            except (IOError, OSError, ValueError) as e:
+                self.data_sent.emit(f"Low-Latency-Modus nicht verfügbar: {e}")
+
+        if sys.platform.startswith('linux'):
+            timer_path = os.path.join('/sys/bus/usb-serial/devices', os.path.basename(port), 'latency_timer')
+            if os.path.exists(timer_path):
+                try:
+                    with open(timer_path, 'w') as f:
+                        f.write(str(latency_timer_ms))
+                except OSError as e: # z.B. PermissionError ohne Root-Rechte
+                    self.data_sent.emit(f"Latenz-Timer konnte nicht gesetzt werden: {e}")
+        elif sys.platform == 'win32':
+            self._check_ftdi_latency_timer_windows(port, latency_timer_ms, write_windows_latency_timer)
+
+    def _check_ftdi_latency_timer_windows(self, port: str, latency_timer_ms: int, write: bool):
+        """
+        Unter Windows liest der FTDI-Treiber den Latenz-Timer aus der Registry
+        (Enum\\FTDIBUS\\<Gerät>\\0000\\Device Parameters). Standardmäßig wird der Wert
+        nur gelesen und bei Bedarf ein Hinweis protokolliert: Schreiben erfordert
+        Administratorrechte, ändert die Einstellung für alle Programme und wirkt
+        erst nach erneutem Einstecken des Adapters, also nicht für diese Sitzung.
+
+        Args:
+            write: Den Wert tatsächlich auf latency_timer_ms setzen (ausdrückliche Zustimmung).
+        """
+        import winreg # Nur unter Windows vorhanden
+        from serial.tools import list_ports
+
+        info = next((p for p in list_ports.comports() if p.device == port), None)
+        if info is None or info.vid != 0x0403 or not info.serial_number: # 0x0403: FTDI
+            return
+        prefix = f"VID_{info.vid:04X}+PID_{info.pid:04X}+{info.serial_number}".upper()
+        base_path = r"SYSTEM\CurrentControlSet\Enum\FTDIBUS"
+        try:
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, base_path) as base:
+                for index in range(winreg.QueryInfoKey(base)[0]): # Anzahl der Unterschlüssel
+                    name = winreg.EnumKey(base, index)
+                    if not name.upper().startswith(prefix):
+                        continue
+                    params_path = rf"{base_path}\{name}\0000\Device Parameters"
+                    with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, params_path) as params:
+                        current, _ = winreg.QueryValueEx(params, "LatencyTimer")
+                    if current <= latency_timer_ms:
+                        return
+                    if not write:
+                        self.data_sent.emit(f"Hinweis: FTDI-Latenz-Timer steht auf {current} ms. Im Geräte-Manager "
+                                            f"(Anschluss > Erweitert) auf {latency_timer_ms} ms setzen, um Antworten "
+                                            "schneller zu erhalten.")
+                        return
+                    with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, params_path, 0, winreg.KEY_SET_VALUE) as params:
+                        winreg.SetValueEx(params, "LatencyTimer", 0, winreg.REG_DWORD, latency_timer_ms)
+                    self.data_sent.emit(f"FTDI-Latenz-Timer von {current} ms auf {latency_timer_ms} ms gesetzt "
+                                        "(wirkt nach erneutem Einstecken des Adapters).")
+                    return
+        except OSError as e: # Schlüssel nicht gefunden oder keine Administratorrechte
+            self.data_sent.emit(f"Latenz-Timer konnte nicht gelesen bzw. gesetzt werden: {e}")
+
     def disconnect(self):
-        """Schließt die serielle Verbindung."""
+        """
+        Schließt die serielle Verbindung. Eine ausgehandelte höhere Baudrate wird
+        vorher zurückgesetzt, damit der nächste Verbindungsaufbau wieder mit der
+        Ausgangsrate funktioniert (fehlt dieser Schritt, findet connect die Rate
+        über _probe_baudrates).
+        """
+        if self._opened:
+            if self._ser.baudrate != self._initial_baudrate:
+                try:
+                    self.send_command(f"serial.baud = {self._initial_baudrate}")
+                    self._ser.flush()
+                except (serial.SerialException, ConnectionError):
+                    pass # Verbindung ohnehin verloren
+            self._close_port()
+            self.data_sent.emit("Verbindung zum Keithley SMU getrennt.")
+
+    def _close_port(self):
+        """Schließt den seriellen Port (auch nach einem fehlgeschlagenen Verbindungsaufbau)."""
+        self._opened = False
+        self._settings_cache.clear()
         if self._ser.is_open:
             self._ser.close()
-            self.data_sent.emit("Disconnected from Keithley SMU.")
 
     def send_command(self, command: str):
         """Sendet einen TSP-Befehl an das Gerät."""
-        if not self._ser.is_open:
+        if not self._opened:
             raise ConnectionError("Keine Verbindung zum Gerät.")
-        cmd_bytes = (command + '\n').encode('ascii')
-        self._ser.write(cmd_bytes)
+        data = _ENCODED_COMMANDS.get(command) # Feste Befehle liegen fertig kodiert vor
+        if data is None:
+            data = self._tx_buf
+            data.clear()
+            data += command.encode('ascii')
+            data += _TSP_EOL_BYTES
+        self._ser.write(data)
         self.data_sent.emit(f"TX: {command}")
-        time.sleep(0.05) # Small delay for command processing
+        if self._post_write_delay:
+            time.sleep(self._post_write_delay)
 
-    def read_response(self) -> str:
-        """Liest eine Antwort vom Gerät."""
-        if self._ser.is_open:
-            response = self._ser.readline().decode('ascii').strip()
+    def send_script(self, lines: list[str]):
+        """
+        Sendet mehrere TSP-Befehle mit einem einzigen Schreibzugriff.
+        Im Log erscheint der Block als eine Zeile (Befehle durch '; ' getrennt).
+        """
+        if not self._opened:
+            raise ConnectionError("Keine Verbindung zum Gerät.")
+        tx_buf = self._tx_buf
+        tx_buf.clear()
+        for line in lines:
+            tx_buf += line.encode('ascii')
+            tx_buf += _TSP_EOL_BYTES
+        self._ser.write(tx_buf)
+        self.data_sent.emit(f"TX: {'; '.join(lines)}")
+        if self._post_write_delay:
+            time.sleep(self._post_write_delay)
+
+    def read_response(self, max_bytes: int = 256, timeout: float = SMU_READ_TIMEOUT_S) -> str:
+        """
+        Liest eine Antwortzeile vom Gerät.
+
+        Args:
+            max_bytes: Obergrenze für die Zeilenlänge; schützt vor endlosem Lesen,
+                       falls das Zeilenende ausbleibt (Antworten sind deutlich kürzer).
+            timeout: Wartezeit auf die Zeile in Sekunden (für Messungen SMU_MEASURE_TIMEOUT_S).
+        """
+        if self._opened:
+            if self._ser.timeout != timeout:
+                self._ser.timeout = timeout # pyserial konfiguriert den Port dabei um, daher nur bei Änderung
+            response = self._ser.read_until(_TSP_EOL_BYTES, max_bytes).decode('ascii').strip()
             self.data_received.emit(f"RX: {response}")
             return response
         return ""
 
-    def query(self, command: str) -> str:
-        """Sendet einen Befehl und liest die Antwort."""
+    def discard_input(self):
+        """Verwirft noch nicht gelesene Antworten (z.B. eine verspätete Zeile nach einem Timeout)."""
+        if self._opened:
+            self._ser.reset_input_buffer()
+
+    def query(self, command: str, timeout: float = SMU_READ_TIMEOUT_S) -> str:
+        """Sendet einen Befehl und liest die Antwort (timeout siehe read_response)."""
         self.send_command(command)
-        return self.read_response()
+        return self.read_response(timeout=timeout)
 
     def reset_channel(self, channel: str):
         """Setzt einen spezifischen SMU-Kanal zurück."""
-        self.send_command(f"smu{channel}.reset()")
+        self._settings_cache.pop(channel, None)
+        self.send_command(_CHANNEL_COMMANDS[channel]['reset'])
 
     def set_source_function(self, channel: str, func: str):
         """Stellt die Source-Funktion (Spannung/Strom) für einen Kanal ein."""
-        self.send_command(f"smu{channel}.source.func = smu{channel}.{func}")
+        self._settings_cache.pop(channel, None)
+        self.send_command(_SOURCE_TEMPLATES[(channel, func)]['func'])
 
     def set_sense_mode(self, channel: str, mode: str):
         """Stellt den Sense-Modus (2- oder 4-Draht) für einen Kanal ein."""
-        self.send_command(f"smu{channel}.sense = smu{channel}.{mode}")
+        self._settings_cache.pop(channel, None)
+        self.send_command(_CHANNEL_COMMANDS[channel]['sense'][mode])
 
     def set_source_level(self, channel: str, func: str, level: float):
         """Stellt das Source-Level (Spannung oder Strom) für einen Kanal ein."""
-        level_cmd = 'levelv' if func == TSP_DC_VOLTS else 'leveli'
-        self.send_command(f"smu{channel}.source.{level_cmd} = {level}")
+        self._settings_cache.pop(channel, None)
+        self.send_command(_SOURCE_TEMPLATES[(channel, func)]['level'] % level)
 
     def set_source_limit(self, channel: str, func: str, limit: float):
         """Stellt den Source-Limit (Strom- oder Spannungslimit) für einen Kanal ein."""
-        limit_cmd = 'limiti' if func == TSP_DC_VOLTS else 'limitv'
-        self.send_command(f"smu{channel}.source.{limit_cmd} = {limit}")
+        self._settings_cache.pop(channel, None)
+        self.send_command(_SOURCE_TEMPLATES[(channel, func)]['limit'] % limit)
+
+    def apply_source_settings(self, channel: str, func: str, level: float, limit: float,
+                              sense_mode: str | None = None, force: bool = True):
+        """
+        Sendet Sense-Modus, Source-Funktion, Level und Limit eines Kanals in einem Schreibzugriff.
+        Mit force=False werden Zeilen weggelassen, die unverändert zuletzt gesendet wurden
+        (z.B. beim erneuten Einschalten des Ausgangs ohne geänderte Einstellungen).
+        """
+        self._send_settings(channel, build_source_settings_script(channel, func, level, limit, sense_mode),
+                            force=force)
+
+    def _send_settings(self, channel: str, lines: list[str], force: bool = False):
+        """
+        Sendet einen Block mit Einstellungszeilen. Ohne force werden Zeilen weggelassen,
+        die genau so zuletzt an diesen Kanal gesendet wurden; ein Wechsel der
+        Source-Funktion verwirft die gemerkten Zeilen des Kanals.
+        """
+        cache = self._settings_cache.setdefault(channel, {})
+        commands = _CHANNEL_COMMANDS[channel]
+        channel_prefix = commands['prefix']
+        output_key = commands['output_key']
+        func_key = commands['func_key']
+        # Neue Source-Funktion: gemerkte Zeilen vor dem Durchlauf verwerfen, damit
+        # im selben Block davor stehende Zeilen (z.B. sense) gemerkt bleiben
+        for line in lines:
+            if line.startswith(func_key + " = "):
+                if cache.get(func_key) != line:
+                    cache.clear()
+                break
+        send_lines = []
+        for line in lines:
+            key, sep, _ = line.partition(" = ")
+            if sep and key.startswith(channel_prefix) and key != output_key:
+                if not force and cache.get(key) == line:
+                    continue # Gerät hat diesen Wert bereits
+                cache[key] = line
+            send_lines.append(line)
+        if not send_lines:
+            return # Alles bereits so eingestellt, kein Schreibzugriff nötig
+        try:
+            self.send_script(send_lines)
+        except Exception:
+            self._settings_cache.pop(channel, None) # Unklar, was angekommen ist
+            raise
 
     def set_output_state(self, channel: str, state: str):
         """Schaltet den Ausgang eines Kanals ein oder aus."""
-        self.send_command(f"smu{channel}.source.output = smu{channel}.{state}")
+        self.send_command(_CHANNEL_COMMANDS[channel]['output'][state])
+
+    def wait_complete(self):
+        """Lässt das Gerät warten, bis alle laufenden (überlappenden) Operationen abgeschlossen sind."""
+        self.send_command("waitcomplete()")
+
+    def all_outputs_off(self):
+        """
+        Schaltet die Ausgänge beider Kanäle mit einem einzigen Schreibzugriff aus.
+        Wird beim Trennen verwendet, damit nur ein Schreibzugriff (und ggf. eine
+        Verarbeitungspause) statt zwei anfällt.
+        """
+        self.send_script([_CHANNEL_COMMANDS['a']['output'][TSP_SMU_OFF],
+                          _CHANNEL_COMMANDS['b']['output'][TSP_SMU_OFF]])
 
     def measure_iv(self, channel: str) -> tuple[float, float]:
         """Misst Strom und Spannung für einen Kanal und gibt sie zurück."""
-        response = self.query(f"print(smu{channel}.measure.iv())")
+        response = self.query(_CHANNEL_COMMANDS[channel]['measure_iv'], timeout=SMU_MEASURE_TIMEOUT_S)
+        return self._parse_iv(response)
+
+    def apply_and_measure_atomic(self, channel: str, func: str, level: float, limit: float,
+                                 settle_time: float = DEFAULT_SETTLE_TIME_S, sense_mode: str | None = None,
+                                 force: bool = False) -> tuple[float, float]:
+        """
+        Setzt Funktion, Level und Limit, schaltet den Ausgang ein, misst I/V und
+        schaltet wieder aus. Alle Befehle gehen in einem Schreibzugriff an das
+        Gerät. Vor der Messung wartet das Gerät per waitcomplete() auf das Ende
+        laufender Operationen, die settle_time (Standard DEFAULT_SETTLE_TIME_S) läuft per delay().
+        Mit sense_mode wird im selben Block auch der Sense-Modus gesetzt.
+        Unveränderte Einstellungen seit dem letzten Aufruf werden nicht erneut
+        gesendet (force=True sendet alle, z.B. nach Bedienung am Gerät).
+
+        Returns:
+            tuple[float, float]: (Strom, Spannung)
+
+        Raises:
+            ConnectionError: Wenn keine Verbindung besteht.
+            ValueError: Wenn die Messantwort nicht gelesen werden kann.
+        """
+        self._send_settings(channel, build_apply_measure_script(channel, func, level, limit, settle_time, sense_mode),
+                            force=force)
+        # Das Gerät wartet vor der Messung settle_time ab
+        return self._parse_iv(self.read_response(timeout=SMU_MEASURE_TIMEOUT_S + max(settle_time, 0.0)))
+
+    def apply_and_measure_batch(self, channel: str, func: str, levels, limit: float,
+                                settle_time: float = DEFAULT_SETTLE_TIME_S) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Führt den Setzen-Messen-Zyklus von apply_and_measure_atomic für alle Werte
+        in 'levels' aus. Die Schleife läuft auf dem Gerät: pro Block von bis zu
+        BATCH_LEVELS_PER_SCRIPT Sollwerten fällt nur ein Schreibzugriff an,
+        danach werden die Messzeilen des Blocks gelesen. Ein Block wird halbiert,
+        bis seine Schleifenzeile höchstens TSP_MAX_LINE_LENGTH Zeichen lang ist.
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray]: (Ströme, Spannungen) in der Reihenfolge von 'levels'.
+        """
+        levels = numpy.asarray(levels, dtype=float)
+        currents = numpy.empty_like(levels)
+        voltages = numpy.empty_like(levels)
+        timeout = SMU_MEASURE_TIMEOUT_S + max(settle_time, 0.0) # Gerät wartet vor jeder Messung
+        start = 0
+        while start < levels.size:
+            block = levels[start:start + BATCH_LEVELS_PER_SCRIPT]
+            script = build_batch_measure_script(channel, func, block, limit, settle_time)
+            while len(script[-1]) > TSP_MAX_LINE_LENGTH and block.size > 1:
+                block = block[:block.size // 2]
+                script = build_batch_measure_script(channel, func, block, limit, settle_time)
+            self._send_settings(channel, script)
+            for index in range(start, start + block.size):
+                currents[index], voltages[index] = self._parse_iv(self.read_response(timeout=timeout))
+            start += block.size
+
+        if levels.size:
+            # Das Gerät steht jetzt auf dem letzten Sollwert
+            level_line = _SOURCE_TEMPLATES[(channel, func)]['level'] % levels[-1]
+            self._settings_cache.setdefault(channel, {})[level_line.partition(" = ")[0]] = level_line
+        return currents, voltages
+
+    @staticmethod
+    def _parse_iv(response: str) -> tuple[float, float]:
+        """Wandelt die Antwort von measure.iv() ("I<TAB>V") in zwei Floats um."""
         try:
-            parts = response.split('\t')
-            return float(parts[0]), float(parts[1])
-        except (ValueError, IndexError):
+            sep = response.index('\t') # Trennzeichen suchen statt Liste per split() anzulegen
+            return float(response[:sep]), float(response[sep + 1:])
+        except ValueError:
             raise ValueError(f"Ungültige Antwort von SMU beim Messen: '{response}'")
 
 
@@ -160,20 +904,68 @@ class DummyKeithley2602(QObject):
         super().__init__()
         self.simulated_resistance = simulated_resistance # Ohms
         self._is_open = False # Simuliert den seriellen Port-Status
-        self.sim_channel_state = { # Simulate internal state of SMU channels
-            'a': {'func': TSP_DC_VOLTS, 'level': 0.0, 'limit': 0.01, 'output': False},
-            'b': {'func': TSP_DC_VOLTS, 'level': 0.0, 'limit': 0.01, 'output': False}
-        }
+        # Simulierter Kanalzustand, ein Dict pro Größe (Kanal -> Wert): Der Messpfad
+        # braucht so nur einen Lookup pro Feld statt Kanal-Dict und Feld-Dict
+        self._sim_func = {'a': TSP_DC_VOLTS, 'b': TSP_DC_VOLTS}
+        self._sim_level = {'a': 0.0, 'b': 0.0}
+        self._sim_limit = {'a': 0.01, 'b': 0.01}
+        self._sim_output = {'a': False, 'b': False}
         self.sim_idn_response = "KEITHLEY INSTRUMENTS INC., MODEL 2602, SIMULATED, 1.0.0"
 
+    # --- Handler für die simulierte Zustandsänderung (Index 3 im Befehl = Kanal) ---
+    def _sim_source_func(self, command: str):
+        if "DCVOLTS" in command: self._sim_func[command[3]] = TSP_DC_VOLTS
+        elif "DCAMPS" in command: self._sim_func[command[3]] = TSP_DC_AMPS
+
+    def _sim_source_level(self, command: str):
+        # "smua.source.l" trifft auch limiti/limitv, nur level* ändert den Zustand
+        if command.startswith("evel", 13):
+            self._sim_level[command[3]] = float(command[command.index('=') + 1:])
+
+    def _sim_source_output(self, command: str):
+        self._sim_output[command[3]] = (TSP_SMU_ON in command)
+
+    # --- Handler mit Antwort (Rückgabewert ist die simulierte Antwortzeile) ---
+    def _sim_idn(self, command: str) -> str:
+        return self.sim_idn_response
+
+    def _sim_measure_iv(self, command: str) -> str:
+        # "print(smua.measure.iv())": Index 9 = Kanal
+        channel = command[9]
+        if not self._sim_output[channel]: # Output is off
+            return "0.0\t0.0"
+        level = self._sim_level[channel]
+        limit = self._sim_limit[channel]
+        if self._sim_func[channel] == TSP_DC_VOLTS:
+            voltage = level
+            current = voltage / self.simulated_resistance + numpy.random.normal(0, limit * 0.1) # Add some noise based on limit
+            # Ensure current doesn't exceed limit
+            current = math.copysign(min(abs(current), limit), current)
+        else: # TSP_DC_AMPS
+            current = level
+            voltage = current * self.simulated_resistance + numpy.random.normal(0, limit * 0.1) # Add some noise based on limit
+            # Ensure voltage doesn't exceed limit
+            voltage = math.copysign(min(abs(voltage), limit), voltage)
+        return f"{current}\t{voltage}"
+
+    _SIM_DISPATCH = {
+        'smua.source.f': _sim_source_func, 'smub.source.f': _sim_source_func,
+        'smua.source.l': _sim_source_level, 'smub.source.l': _sim_source_level,
+        'smua.source.o': _sim_source_output, 'smub.source.o': _sim_source_output,
+        'print(smua.me': _sim_measure_iv, 'print(smub.me': _sim_measure_iv,
+        '*IDN?': _sim_idn,
+    }
+
     @property
     def is_open(self) -> bool:
         """Gibt den simulierten Verbindungsstatus zurück."""
         return self._is_open
 
-    def connect(self, port: str, baudrate: int = 115200) -> tuple[bool, str]:
-        """Simuliert eine Verbindung."""
-        self.data_sent.emit(f"Simulating connection to {port}...")
+    def connect(self, port: str, baudrate: int = SMU_DEFAULT_BAUDRATE, low_latency: bool = True,
+                latency_timer_ms: int = 1, preferred_baudrate: int | None = None,
+                write_windows_latency_timer: bool = False) -> tuple[bool, str]:
+        """Simuliert eine Verbindung (Latenz- und Baudraten-Parameter werden ignoriert)."""
+        self.data_sent.emit(f"Simuliere Verbindung mit {port}...")
         time.sleep(0.1) # Simulate a slight delay
         self._is_open = True
         self.data_received.emit(f"Simulated RX: {self.sim_idn_response}")
@@ -183,99 +975,162 @@ class DummyKeithley2602(QObject):
         """Simuliert das Trennen der Verbindung."""
         if self._is_open:
             self._is_open = False
-            self.data_sent.emit("Simulated disconnection from Keithley SMU.")
+            self.data_sent.emit("Simulierte Verbindung zum Keithley SMU getrennt.")
 
     def send_command(self, command: str):
         """Simuliert das Senden eines Befehls und aktualisiert den internen Zustand."""
         if not self._is_open:
             raise ConnectionError("Simulated: Keine Verbindung zum Gerät.")
         self.data_sent.emit(f"Simulated TX: {command}")
+        self._simulate_command(command)
+
+    def send_script(self, lines: list[str]):
+        """Simuliert das Senden mehrerer Befehle in einem Schreibzugriff."""
+        if not self._is_open:
+            raise ConnectionError("Simulated: Keine Verbindung zum Gerät.")
+        self.data_sent.emit(f"Simulated TX: {'; '.join(lines)}")
+        for line in lines:
+            self._simulate_command(line)
 
-        # Update internal state based on command (simplified for common commands)
-        if "smua.source.func" in command:
-            if "DCVOLTS" in command: self.sim_channel_state['a']['func'] = TSP_DC_VOLTS
-            elif "DCAMPS" in command: self.sim_channel_state['a']['func'] = TSP_DC_AMPS
-        elif "smub.source.func" in command:
-            if "DCVOLTS" in command: self.sim_channel_state['b']['func'] = TSP_DC_VOLTS
-            elif "DCAMPS" in command: self.sim_channel_state['b']['func'] = TSP_DC_AMPS
-
-        if "smua.source.levelv" in command:
-            self.sim_channel_state['a']['level'] = float(command.split('=')[1].strip())
-        elif "smua.source.leveli" in command:
-            self.sim_channel_state['a']['level'] = float(command.split('=')[1].strip())
-        elif "smub.source.levelv" in command:
-            self.sim_channel_state['b']['level'] = float(command.split('=')[1].strip())
-        elif "smub.source.leveli" in command:
-            self.sim_channel_state['b']['level'] = float(command.split('=')[1].strip())
-
-        if "smua.source.output" in command:
-            self.sim_channel_state['a']['output'] = (TSP_SMU_ON in command)
-        elif "smub.source.output" in command:
-            self.sim_channel_state['b']['output'] = (TSP_SMU_ON in command)
-
-        time.sleep(0.01) # Simulate a small command processing delay
-
-    def read_response(self) -> str:
+    def _simulate_command(self, command: str) -> str | None:
+        """
+        Aktualisiert den simulierten Gerätezustand anhand eines Befehls und
+        gibt die simulierte Antwort zurück (None bei Befehlen ohne Antwort).
+        """
+        # Update internal state based on command (simplified for common commands).
+        # Die ersten 13 Zeichen ("smua.source.f" usw.) bestimmen den Handler direkt,
+        # statt den Befehl mehrfach nach Teilstrings zu durchsuchen.
+        handler = self._SIM_DISPATCH.get(command[:13])
+        if handler:
+            return handler(self, command)
+        return None
+
+    def read_response(self, max_bytes: int = 256, timeout: float = SMU_READ_TIMEOUT_S) -> str:
         """Simuliert das Lesen einer Antwort."""
         if not self._is_open: return ""
         response = "OK" # Generic OK response for most non-query commands
         self.data_received.emit(f"Simulated RX: {response}")
         return response
 
-    def query(self, command: str) -> str:
-        """Simuliert das Senden eines Befehls und die Rückgabe einer Antwort."""
-        self.send_command(command) # Log the command first
+    def discard_input(self):
+        pass # Keine gepufferten Antworten in der Simulation
 
-        response = ""
-        if command == "*IDN?":
-            response = self.sim_idn_response
-        elif "print(smu" in command and ".measure.iv())" in command:
-            channel = command.split('smu')[1].split('.')[0]
-            if channel in self.sim_channel_state:
-                state = self.sim_channel_state[channel]
-                if state['output']:
-                    if state['func'] == TSP_DC_VOLTS:
-                        voltage = state['level']
-                        current = voltage / self.simulated_resistance + numpy.random.normal(0, state['limit'] * 0.1) # Add some noise based on limit
-                        # Ensure current doesn't exceed limit
-                        current = numpy.sign(current) * min(abs(current), state['limit'])
-                    else: # TSP_DC_AMPS
-                        current = state['level']
-                        voltage = current * self.simulated_resistance + numpy.random.normal(0, state['limit'] * 0.1) # Add some noise based on limit
-                        # Ensure voltage doesn't exceed limit
-                        voltage = numpy.sign(voltage) * min(abs(voltage), state['limit'])
-                else: # Output is off
-                    voltage = 0.0
-                    current = 0.0
-                response = f"{current}\t{voltage}"
-            else:
-                response = "0.0\t0.0" # Default for unknown channel
-        else:
+    def query(self, command: str, timeout: float = SMU_READ_TIMEOUT_S) -> str:
+        """Simuliert das Senden eines Befehls und die Rückgabe einer Antwort."""
+        if not self._is_open:
+            raise ConnectionError("Simulated: Keine Verbindung zum Gerät.")
+        self.data_sent.emit(f"Simulated TX: {command}")
+        # Befehl wird nur einmal ausgewertet; Handler ohne Antwort liefern None
+        response = self._simulate_command(command)
+        if response is None:
             response = "OK" # Generic response for other queries
 
         self.data_received.emit(f"Simulated RX: {response}")
         return response
 
     # The following methods just call send_command or query, which are already simulated
-    def reset_channel(self, channel: str): self.send_command(f"smu{channel}.reset()")
-    def set_source_function(self, channel: str, func: str): self.send_command(f"smu{channel}.source.func = smu{channel}.{func}")
-    def set_sense_mode(self, channel: str, mode: str): self.send_command(f"smu{channel}.sense = smu{channel}.{mode}")
+    def reset_channel(self, channel: str): self.send_command(_CHANNEL_COMMANDS[channel]['reset'])
+    def set_source_function(self, channel: str, func: str): self.send_command(_SOURCE_TEMPLATES[(channel, func)]['func'])
+    def set_sense_mode(self, channel: str, mode: str): self.send_command(_CHANNEL_COMMANDS[channel]['sense'][mode])
     def set_source_level(self, channel: str, func: str, level: float):
-        level_cmd = 'levelv' if func == TSP_DC_VOLTS else 'leveli'
-        self.send_command(f"smu{channel}.source.{level_cmd} = {level}")
+        self.send_command(_SOURCE_TEMPLATES[(channel, func)]['level'] % level)
     def set_source_limit(self, channel: str, func: str, limit: float):
-        limit_cmd = 'limiti' if func == TSP_DC_VOLTS else 'limitv'
-        self.send_command(f"smu{channel}.source.{limit_cmd} = {limit}")
-    def set_output_state(self, channel: str, state: str): self.send_command(f"smu{channel}.source.output = smu{channel}.{state}")
+        self.send_command(_SOURCE_TEMPLATES[(channel, func)]['limit'] % limit)
+    def set_output_state(self, channel: str, state: str): self.send_command(_CHANNEL_COMMANDS[channel]['output'][state])
+    def wait_complete(self): self.send_command("waitcomplete()")
+    def all_outputs_off(self):
+        self.send_script([_CHANNEL_COMMANDS['a']['output'][TSP_SMU_OFF],
+                          _CHANNEL_COMMANDS['b']['output'][TSP_SMU_OFF]])
     def measure_iv(self, channel: str) -> tuple[float, float]:
-        response = self.query(f"print(smu{channel}.measure.iv())")
+        response = self.query(_CHANNEL_COMMANDS[channel]['measure_iv'])
+        return self._parse_iv(response)
+    def apply_source_settings(self, channel: str, func: str, level: float, limit: float,
+                              sense_mode: str | None = None, force: bool = True):
+        self.send_script(build_source_settings_script(channel, func, level, limit, sense_mode))
+
+    def apply_and_measure_atomic(self, channel: str, func: str, level: float, limit: float,
+                                 settle_time: float = DEFAULT_SETTLE_TIME_S, sense_mode: str | None = None,
+                                 force: bool = False) -> tuple[float, float]:
+        """
+        Simuliert den Setzen-Messen-Zyklus wie das echte Gerät: ein TX-Block,
+        Zustand und Messwert werden in einem Durchlauf berechnet, eine RX-Zeile.
+        """
+        if not self._is_open:
+            raise ConnectionError("Simulated: Keine Verbindung zum Gerät.")
+        lines = build_apply_measure_script(channel, func, level, limit, settle_time, sense_mode)
+        self.data_sent.emit(f"Simulated TX: {'; '.join(lines)}")
+        response = ""
+        for line in lines:
+            if line.startswith("delay("):
+                time.sleep(settle_time)
+                continue
+            line_response = self._simulate_command(line)
+            if line_response is not None:
+                response = line_response
+        self.data_received.emit(f"Simulated RX: {response}")
+        return self._parse_iv(response)
+    def apply_and_measure_batch(self, channel: str, func: str, levels, limit: float,
+                                settle_time: float = DEFAULT_SETTLE_TIME_S) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Simuliert apply_and_measure_atomic für alle Werte in 'levels' auf einmal:
+        Ohmsches Gesetz, Rauschen und Begrenzung werden als NumPy-Arrayoperationen
+        berechnet statt Punkt für Punkt.
+        """
+        if not self._is_open:
+            raise ConnectionError("Simulated: Keine Verbindung zum Gerät.")
+        levels = numpy.asarray(levels, dtype=float)
+        self.data_sent.emit(f"Simulated TX: {levels.size} x Setzen/Messen smu{channel} ({func}, Limit {limit})")
+        if settle_time > 0:
+            time.sleep(settle_time * levels.size)
+
+        # Rauschen und Begrenzung wie im Einzelpfad (_sim_measure_iv) mit dem simulierten Limit
+        sim_limit = self._sim_limit[channel]
+        noise = numpy.random.normal(0, sim_limit * 0.1, levels.size) # Add some noise based on limit
+        if func == TSP_DC_VOLTS:
+            voltages = levels.copy()
+            currents = numpy.clip(levels / self.simulated_resistance + noise, -sim_limit, sim_limit)
+        else: # TSP_DC_AMPS
+            currents = levels.copy()
+            voltages = numpy.clip(levels * self.simulated_resistance + noise, -sim_limit, sim_limit)
+
+        # Zustand wie nach dem letzten Einzelzyklus: Sollwerte gesetzt, Ausgang aus
+        self._sim_func[channel] = func
+        if levels.size:
+            self._sim_level[channel] = float(levels[-1])
+        self._sim_output[channel] = False
+
+        self.data_received.emit(f"Simulated RX: {levels.size} Messpunkte")
+        return currents, voltages
+    @staticmethod
+    def _parse_iv(response: str) -> tuple[float, float]:
         try:
-            parts = response.split('\t')
-            return float(parts[0]), float(parts[1])
-        except (ValueError, IndexError):
+            sep = response.index('\t')
+            return float(response[:sep]), float(response[sep + 1:])
+        except ValueError:
             raise ValueError(f"Simulated: Ungültige Antwort beim Messen: '{response}'")
 
 
+@dataclass(slots=True)
+class ChannelWidgets:
+    """Bedienelemente und zuletzt angezeigte Messwerte eines SMU-Kanals."""
+    group: QGroupBox
+    rb_voltage: QRadioButton
+    rb_current: QRadioButton
+    level_input: QLineEdit
+    limit_input: QLineEdit
+    sense_local: QRadioButton
+    sense_remote: QRadioButton
+    v_read_label: QLabel
+    i_read_label: QLabel
+    output_btn: QPushButton
+    source_func_button_group: QButtonGroup
+    sense_mode_button_group: QButtonGroup
+    last_v_text: str = "--- V" # Zuletzt angezeigte Texte, um unnötige setText-Aufrufe zu sparen
+    last_i_text: str = "--- A"
+    v_last: float | None = None # Zuletzt angezeigte Messwerte (None = Platzhalter)
+    i_last: float | None = None
+
+
 class SmuTab(QWidget):
     """
     Haupt-Widget für den SMU-Steuerungs-Tab.
@@ -283,13 +1138,66 @@ class SmuTab(QWidget):
     instanziiert den entsprechenden Treiber (echt oder Dummy) und stellt
     eine High-Level-API-Methode für andere Module im Workbench bereit.
     """
+    # Fertig formatierte Log-Zeile aus dem Logging-Thread (wird im GUI-Thread verarbeitet)
+    _log_line_ready = pyqtSignal(str)
+    # Auftrag (Future, Funktion, Argumente) für den I/O-Thread
+    _io_job = pyqtSignal(object)
+    # Abgeschlossener Auftrag mit Rückruf (Future, Callback), wird im GUI-Thread zugestellt
+    _io_done = pyqtSignal(object, object)
+    # Fehlermeldung der High-Level-API (evtl. aus einem Worker-Thread), Anzeige im GUI-Thread
+    _api_error = pyqtSignal(str)
+    # Verbindung verloren (evtl. aus einem Worker-Thread), getrennt wird im GUI-Thread
+    _connection_lost = pyqtSignal()
+    # Ergebnis der High-Level-API (Kanal, Level, Limit, Strom, Spannung) für das Kanal-UI;
+    # aus einem Worker-Thread wird es in die Event-Queue des GUI-Threads gestellt
+    _apply_result_ready = pyqtSignal(str, float, float, float, float)
+
     def __init__(self, shared_data):
         super().__init__()
         self.shared_data = shared_data
         self.smu_driver = None # Renamed from 'keithley' for clarity (can be real or dummy)
-        self.channel_widgets = {}
+        self.channel_widgets: dict[str, ChannelWidgets] = {}
         self.channel_output_state = {'a': False, 'b': False}
 
+        # Puffer für Log-Zeilen: Viele Meldungen werden gesammelt und per Timer
+        # in einem Schritt angezeigt, statt das Widget pro Meldung zu aktualisieren
+        self._log_buffer = collections.deque(maxlen=SERIAL_LOG_MAX_BLOCKS)
+        self._log_flush_pending = False
+        self._log_sticky_bottom = True # Log folgt neuen Zeilen, solange der Benutzer nicht hochscrollt
+        self._init_serial_logger()
+
+        self.apply_retries = APPLY_RETRIES # Wiederholungen bei fehlender Antwort (0 = aus)
+
+        # Puffer für apply_and_measure(defer_ui=True): Ergebnisse werden als
+        # Spalten (Struct of Arrays) gesammelt und erst in flush_deferred_ui angezeigt
+        self._reset_sweep_buffer()
+
+        # Zuletzt gefundene COM-Ports; die Combobox zeigt diese sofort an,
+        # während eine neue Suche im Hintergrund läuft
+        self._port_cache: list[str] = []
+        self._port_cache_ts = None # time.monotonic() der letzten Suche
+        self._port_scan_thread = None
+        self._port_rescan_pending = False # Änderung während einer laufenden Suche gemeldet
+        # Meldet An-/Abstecken von Geräten; solange aktiv, bleibt der Cache bis zur nächsten Änderung gültig
+        self._port_watcher = _PortWatcher(self)
+        self._port_watcher.ports_changed.connect(self._on_ports_changed)
+
+        # Serielle Kommunikation läuft in einem eigenen Thread (wird beim Verbinden gestartet),
+        # damit Lesezugriffe die GUI nicht blockieren
+        self._io_thread = None
+        self._io_worker = None
+        # Schützt _io_thread beim Einreihen (aus jedem Thread) und die Menge der noch
+        # offenen Aufträge, die _stop_io_thread beim Beenden mit einem Fehler abschließt
+        self._io_lock = threading.Lock()
+        self._io_pending: set[Future] = set()
+        self._io_done.connect(self._on_io_done)
+        self._api_error.connect(self._show_api_error)
+        self._connection_lost.connect(self._on_connection_lost)
+        self._apply_result_ready.connect(self._show_apply_result)
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._on_app_quit)
+
         # Hauptlayout für diesen Tab
         self.main_layout = QVBoxLayout(self)
         self._create_com_port_ui()
@@ -299,6 +1207,9 @@ class SmuTab(QWidget):
         # WICHTIG: Die High-Level-Funktion im SharedState registrieren
         # Dies ist die High-Level-API des SMU-Moduls (Regel 2.2)
         self.shared_data.smu_apply_and_measure = self.apply_and_measure
+        self.shared_data.smu_flush_deferred_ui = self.flush_deferred_ui
+        self.shared_data.smu_apply_and_measure_batch = self.apply_and_measure_batch
+        self.shared_data.smu_apply_and_measure_async = self.apply_and_measure_async
 
         # Initialer Refresh der COM-Ports beim Start
         self._refresh_com_ports()
@@ -315,6 +1226,28 @@ class SmuTab(QWidget):
         self.com_port_combo.activated.connect(self._refresh_com_ports)
         com_layout.addWidget(self.com_port_combo)
 
+        com_layout.addWidget(QLabel("Geräte-Baudrate:"))
+        self.device_baudrate_combo = QComboBox()
+        for baudrate in SMU_BAUDRATES:
+            self.device_baudrate_combo.addItem(str(baudrate), baudrate)
+        self.device_baudrate_combo.setCurrentIndex(self.device_baudrate_combo.findData(SMU_DEFAULT_BAUDRATE))
+        self.device_baudrate_combo.setToolTip(
+            "Am Gerät eingestellte Baudrate (MENU > RS232 > BAUD).\n"
+            "Antwortet das Gerät nicht, werden die übrigen Raten probiert."
+        )
+        com_layout.addWidget(self.device_baudrate_combo)
+
+        com_layout.addWidget(QLabel("Wechseln auf:"))
+        self.switch_baudrate_combo = QComboBox()
+        self.switch_baudrate_combo.addItem("Nicht wechseln", None)
+        for baudrate in SMU_BAUDRATES:
+            self.switch_baudrate_combo.addItem(str(baudrate), baudrate)
+        self.switch_baudrate_combo.setToolTip(
+            "Nach dem Verbinden per serial.baud auf diese Rate umstellen (beim Trennen wird zurückgestellt).\n"
+            "Akzeptiert das Gerät sie nicht, bleibt es bei der Geräte-Baudrate (siehe serielles Log)."
+        )
+        com_layout.addWidget(self.switch_baudrate_combo)
+
         self.dummy_mode_checkbox = QCheckBox("Dummy Modus")
         self.dummy_mode_checkbox.stateChanged.connect(self._on_dummy_mode_changed)
         com_layout.addWidget(self.dummy_mode_checkbox)
@@ -330,6 +1263,11 @@ class SmuTab(QWidget):
 
         self.status_label = QLabel("Status: Nicht verbunden")
         font = QFont(); font.setBold(True); self.status_label.setFont(font)
+        # Beide Paletten einmal anlegen; beim Statuswechsel wird nur noch umgeschaltet
+        self._status_palette_ok = QPalette(self.status_label.palette())
+        self._status_palette_ok.setColor(QPalette.ColorRole.WindowText, QColor("green"))
+        self._status_palette_bad = QPalette(self.status_label.palette())
+        self._status_palette_bad.setColor(QPalette.ColorRole.WindowText, QColor("red"))
         self._update_status_color(False)
         com_layout.addStretch() # Push status label to the right
         com_layout.addWidget(self.status_label)
@@ -339,15 +1277,24 @@ class SmuTab(QWidget):
         # Serial Log GroupBox and TextEdit
         log_groupbox = QGroupBox("Serielle Kommunikation Log")
         log_layout = QVBoxLayout()
-        self.serial_log_textedit = QTextEdit()
+        # QPlainTextEdit statt QTextEdit: zeilenbasiertes Layout ohne Rich-Text,
+        # die Blockbegrenzung hält Speicher und Layoutkosten konstant
+        self.serial_log_textedit = QPlainTextEdit()
         self.serial_log_textedit.setReadOnly(True)
-        self.serial_log_textedit.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
+        self.serial_log_textedit.setUndoRedoEnabled(False)
+        self.serial_log_textedit.setMaximumBlockCount(SERIAL_LOG_MAX_BLOCKS)
+        self.serial_log_textedit.setToolTip(
+            f"Serielle Kommunikation mit der SMU (es bleiben die letzten {SERIAL_LOG_MAX_BLOCKS} Zeilen erhalten)")
+        self.serial_log_textedit.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
         self.serial_log_textedit.setFont(QFont("Monospace", 9))
 
         self.serial_log_textedit.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self.serial_log_textedit.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self.serial_log_textedit.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.serial_log_textedit.setMinimumHeight(100)
+        self.serial_log_textedit.setCenterOnScroll(False)
+        # Scrollposition nur bei Benutzeränderung auswerten statt bei jedem Anhängen
+        self.serial_log_textedit.verticalScrollBar().valueChanged.connect(self._on_log_scrolled)
 
         log_layout.addWidget(self.serial_log_textedit)
         log_groupbox.setLayout(log_layout)
@@ -360,9 +1307,9 @@ class SmuTab(QWidget):
             self._disconnect_smu()
 
         # Clear log on mode change
+        self._log_buffer.clear()
         self.serial_log_textedit.clear()
-        self.serial_log_textedit.append(
-            f"[{datetime.now().strftime('%H:%M:%S.%f')[:-3]}] "
+        self._logger.info(
             f"Dummy Modus: {'AKTIVIERT' if state == Qt.CheckState.Checked.value else 'DEAKTIVIERT'}"
         )
         self._refresh_com_ports() # Refresh ports to show "COM_DUMMY" or real ones
@@ -456,43 +1403,107 @@ class SmuTab(QWidget):
         channel_group.setLayout(main_v_layout)
 
         # Store all created widgets in the channel_widgets dictionary
-        self.channel_widgets[channel_id] = {
-            'group': channel_group,
-            'rb_voltage': rb_voltage,
-            'rb_current': rb_current,
-            'level_input': level_input,
-            'limit_input': limit_input,
-            'sense_local': sense_local,
-            'sense_remote': sense_remote,
-            'v_read_label': v_read_label,
-            'i_read_label': i_read_label,
-            'output_btn': output_btn,
-            'source_func_button_group': source_func_button_group,
-            'sense_mode_button_group': sense_mode_button_group
-        }
+        self.channel_widgets[channel_id] = ChannelWidgets(
+            group=channel_group,
+            rb_voltage=rb_voltage,
+            rb_current=rb_current,
+            level_input=level_input,
+            limit_input=limit_input,
+            sense_local=sense_local,
+            sense_remote=sense_remote,
+            v_read_label=v_read_label,
+            i_read_label=i_read_label,
+            output_btn=output_btn,
+            source_func_button_group=source_func_button_group,
+            sense_mode_button_group=sense_mode_button_group
+        )
         return channel_group
 
     def _refresh_com_ports(self):
-        """Aktualisiert die Liste der verfügbaren COM-Ports in der Combobox."""
-        current_port = self.com_port_combo.currentText()
-        self.com_port_combo.clear()
-
-        if not self.dummy_mode_checkbox.isChecked():
-            available_ports = [port.device for port in list_ports.comports()]
-            self.com_port_combo.addItems(available_ports)
-            if current_port and current_port in available_ports:
-                self.com_port_combo.setCurrentText(current_port)
-            elif available_ports:
-                self.com_port_combo.setCurrentIndex(0)
-        else:
-            self.com_port_combo.addItem("COM_DUMMY")
-            self.com_port_combo.setCurrentText("COM_DUMMY")
+        """
+        Aktualisiert die Liste der verfügbaren COM-Ports in der Combobox.
+        Die Combobox zeigt sofort die zuletzt bekannten Ports; die eigentliche
+        Suche läuft in einem Hintergrund-Thread. Mit aktivem Port-Watcher wird
+        nur nach einer gemeldeten Änderung neu gesucht, sonst höchstens einmal
+        pro PORT_SCAN_CACHE_S Sekunden.
+        """
+        # Bei aktiver Verbindung ist die Combobox gesperrt, eine Port-Suche wäre unnötig
+        if self.smu_driver is not None and self.smu_driver.is_open:
+            return
+
+        if self.dummy_mode_checkbox.isChecked():
+            self._update_port_combo([DUMMY_PORT])
+            return
+
+        self._update_port_combo(self._port_cache)
+        if self._port_scan_thread is not None:
+            return # Suche läuft bereits, Ergebnis kommt über _on_ports_scanned
+        if self._port_cache_ts is not None and (
+                self._port_watcher.active or time.monotonic() - self._port_cache_ts < PORT_SCAN_CACHE_S):
+            return
+
+        self._port_scan_thread = QThread(self) # Parent hält den Thread am Leben, bis deleteLater greift
+        self._port_scan_worker = _PortScanWorker()
+        self._port_scan_worker.moveToThread(self._port_scan_thread)
+
+        self._port_scan_thread.started.connect(self._port_scan_worker.run)
+        self._port_scan_worker.finished.connect(self._on_ports_scanned)
+        self._port_scan_worker.finished.connect(self._port_scan_thread.quit)
+        self._port_scan_worker.finished.connect(self._port_scan_worker.deleteLater)
+        self._port_scan_thread.finished.connect(self._port_scan_thread.deleteLater)
+
+        self._port_scan_thread.start()
+
+    def _on_ports_changed(self):
+        """Ein Gerät wurde an- oder abgesteckt: Cache verwerfen und neu suchen."""
+        self._port_cache_ts = None
+        if self._port_scan_thread is not None:
+            self._port_rescan_pending = True # Laufende Suche könnte die Änderung verpasst haben
+            return
+        self._refresh_com_ports()
+
+    @pyqtSlot(list)
+    def _on_ports_scanned(self, ports: list):
+        """Übernimmt das Ergebnis der Port-Suche (läuft im GUI-Thread)."""
+        self._port_scan_thread = None
+        self._port_cache = ports
+        self._port_cache_ts = time.monotonic()
+        if self._port_rescan_pending:
+            self._port_rescan_pending = False
+            self._port_cache_ts = None
+            QTimer.singleShot(0, self._refresh_com_ports)
+
+        # Im Dummy-Modus oder bei aktiver Verbindung nur den Cache aktualisieren
+        if self.dummy_mode_checkbox.isChecked():
+            return
+        if self.smu_driver is not None and self.smu_driver.is_open:
+            return
+        self._update_port_combo(ports)
+
+    def _update_port_combo(self, ports: list[str]):
+        """
+        Gleicht die Einträge der Combobox mit 'ports' ab. Es werden nur entfernte
+        bzw. neue Ports geändert, die aktuelle Auswahl bleibt erhalten (kein clear()).
+        """
+        combo = self.com_port_combo
+        old_ports = [combo.itemText(i) for i in range(combo.count())]
+        if set(old_ports) == set(ports):
+            return
+
+        new_set = set(ports)
+        for index in reversed(range(len(old_ports))):
+            if old_ports[index] not in new_set:
+                combo.removeItem(index)
+
+        old_set = set(old_ports)
+        combo.addItems([port for port in ports if port not in old_set])
+
+        if combo.currentIndex() < 0 and combo.count() > 0:
+            combo.setCurrentIndex(0)
 
     def _update_status_color(self, connected: bool):
         """Aktualisiert die Farbe des Status-Labels."""
-        palette = self.status_label.palette()
-        palette.setColor(QPalette.ColorRole.WindowText, QColor("green") if connected else QColor("red"))
-        self.status_label.setPalette(palette)
+        self.status_label.setPalette(self._status_palette_ok if connected else self._status_palette_bad)
 
     def _connect_smu(self):
         """Stellt eine Verbindung zum SMU (echt oder Dummy) her."""
@@ -508,11 +1519,15 @@ class SmuTab(QWidget):
             self.smu_driver = Keithley2602()
 
         # IMPORTANT: Connect signals AFTER driver instantiation
-        self.smu_driver.data_sent.connect(self._update_serial_log)
-        self.smu_driver.data_received.connect(self._update_serial_log)
+        # DirectConnection: Der Logger ist threadsicher, die Meldungen aus dem I/O-Thread
+        # brauchen keinen Umweg über die Event-Queue des GUI-Threads
+        self.smu_driver.data_sent.connect(self._update_serial_log, Qt.ConnectionType.DirectConnection)
+        self.smu_driver.data_received.connect(self._update_serial_log, Qt.ConnectionType.DirectConnection)
 
         # Attempt to connect
-        is_connected, message = self.smu_driver.connect(port)
+        is_connected, message = self.smu_driver.connect(port,
+                                                        baudrate=self.device_baudrate_combo.currentData(),
+                                                        preferred_baudrate=self.switch_baudrate_combo.currentData())
 
         if is_connected:
             # Check if it's the expected Keithley SMU (or dummy)
@@ -527,8 +1542,11 @@ class SmuTab(QWidget):
                 self.connect_button.setEnabled(False)
                 self.disconnect_button.setEnabled(True)
                 self.com_port_combo.setEnabled(False)
+                self.device_baudrate_combo.setEnabled(False)
+                self.switch_baudrate_combo.setEnabled(False)
                 self.dummy_mode_checkbox.setEnabled(False)
                 self._set_channel_controls_enabled(True)
+                self._start_io_thread()
                 # Store the connected SMU driver instance in SharedState (Rule 2.1)
                 self.shared_data.smu_device = self.smu_driver
             else:
@@ -551,13 +1569,16 @@ class SmuTab(QWidget):
         if self.smu_driver:
             try:
                 if self.smu_driver.is_open:
-                    # Ensure outputs are turned off before disconnecting
-                    self.smu_driver.set_output_state('a', TSP_SMU_OFF)
-                    self.smu_driver.set_output_state('b', TSP_SMU_OFF)
-            except ConnectionError:
+                    # Ensure outputs are turned off before disconnecting (one write for both channels)
+                    self._call_io(self.smu_driver.all_outputs_off)
+            except CONNECTION_ERRORS:
                 pass # Ignore if connection is already lost
 
-            self.smu_driver.disconnect()
+            try:
+                self._call_io(self.smu_driver.disconnect)
+            except CONNECTION_ERRORS:
+                pass # Port wird beim Beenden des I/O-Threads nicht mehr benutzt
+            self._stop_io_thread()
             # Disconnect signals to prevent memory leaks, especially if driver object is replaced
             try:
                 self.smu_driver.data_sent.disconnect(self._update_serial_log)
@@ -570,17 +1591,18 @@ class SmuTab(QWidget):
         self.connect_button.setEnabled(True)
         self.disconnect_button.setEnabled(False)
         self.com_port_combo.setEnabled(True)
+        self.device_baudrate_combo.setEnabled(True)
+        self.switch_baudrate_combo.setEnabled(True)
         self.dummy_mode_checkbox.setEnabled(True)
         self._set_channel_controls_enabled(False)
 
         # Reset UI elements for channels
         for ch_id in ['a', 'b']:
             widgets = self.channel_widgets[ch_id]
-            widgets['output_btn'].setChecked(False)
-            widgets['output_btn'].setText("OUTPUT ON")
+            widgets.output_btn.setChecked(False)
+            widgets.output_btn.setText("OUTPUT ON")
             self.channel_output_state[ch_id] = False
-            widgets['v_read_label'].setText("--- V")
-            widgets['i_read_label'].setText("--- A")
+            self._clear_readings(widgets)
 
         # Clear the SMU driver instance from SharedState (Rule 2.1)
         self.shared_data.smu_device = None
@@ -589,160 +1611,605 @@ class SmuTab(QWidget):
     def _set_channel_controls_enabled(self, enabled: bool):
         """Aktiviert oder deaktiviert die Steuerelemente der Kanäle."""
         for channel in self.channel_widgets.values():
-            channel['group'].setEnabled(enabled)
+            channel.group.setEnabled(enabled)
+
+    def _read_source_inputs(self, channel_id: str) -> tuple[str, float, float, str]:
+        """
+        Liest die Source-Parameter eines Kanals aus dem UI (GUI-Thread).
+
+        Returns:
+            tuple[str, float, float, str]: (Source-Funktion, Level, Limit, Sense-Modus)
 
-    def _apply_source_settings(self, channel_id: str) -> bool:
-        """Wendet die eingestellten Source-Parameter auf den SMU-Kanal an."""
+        Raises:
+            ValueError: Wenn Level oder Limit keine gültige Zahl ist.
+        """
         widgets = self.channel_widgets[channel_id]
-        is_voltage_source = widgets['rb_voltage'].isChecked()
-        func = TSP_DC_VOLTS if is_voltage_source else TSP_DC_AMPS
-        sense_mode = TSP_SENSE_LOCAL if widgets['sense_local'].isChecked() else TSP_SENSE_REMOTE
-        try:
-            level = float(widgets['level_input'].text())
-            limit = float(widgets['limit_input'].text())
-
-            if self.smu_driver and self.smu_driver.is_open:
-                self.smu_driver.set_sense_mode(channel_id, sense_mode)
-                self.smu_driver.set_source_function(channel_id, func)
-                self.smu_driver.set_source_level(channel_id, func, level)
-                self.smu_driver.set_source_limit(channel_id, func, limit)
-                return True
-            else:
-                QMessageBox.critical(self, "Fehler", "SMU ist nicht verbunden.")
-                return False
-        except (ValueError, ConnectionError) as e:
-            QMessageBox.critical(self, "Eingabefehler", f"Fehler beim Anwenden der Einstellungen: {e}")
-            if isinstance(e, ConnectionError):
-                self._disconnect_smu() # Disconnect on connection error
-            return False
+        func = SOURCE_FUNCS[SourceMode.VOLTAGE if widgets.rb_voltage.isChecked() else SourceMode.CURRENT]
+        sense_mode = TSP_SENSE_LOCAL if widgets.sense_local.isChecked() else TSP_SENSE_REMOTE
+        level = float(widgets.level_input.text())
+        limit = float(widgets.limit_input.text())
+        return func, level, limit, sense_mode
 
-    def _toggle_output(self, channel_id: str):
-        """Schaltet den Ausgang eines SMU-Kanals ein oder aus."""
-        button = self.channel_widgets[channel_id]['output_btn']
-        new_state_on = not self.channel_output_state[channel_id] # Desired state
+    def _io_error_message(self, future: Future) -> str:
+        """
+        Wertet einen abgeschlossenen I/O-Auftrag aus (GUI-Thread). Bei einem
+        Verbindungsfehler wird die Verbindung getrennt.
 
+        Returns:
+            str: Fehlermeldung oder "" bei Erfolg.
+        """
         try:
-            if new_state_on: # If turning ON, apply settings first
-                if not self._apply_source_settings(channel_id):
-                    button.setChecked(False) # Keep button off if settings failed
-                    return
-
-            state_cmd = TSP_SMU_ON if new_state_on else TSP_SMU_OFF
-            if self.smu_driver and self.smu_driver.is_open:
-                self.smu_driver.set_output_state(channel_id, state_cmd)
-                button.setText("OUTPUT OFF" if new_state_on else "OUTPUT ON")
-                self.channel_output_state[channel_id] = new_state_on
-                button.setChecked(new_state_on) # Update button state
-            else:
-                QMessageBox.critical(self, "Fehler", "SMU ist nicht verbunden.")
-                button.setChecked(False)
-        except ConnectionError as e:
-            QMessageBox.critical(self, "Verbindungsfehler", f"Fehler beim Schalten des Outputs: {e}")
-            self._disconnect_smu() # Disconnect on connection error
+            future.result()
+        except CONNECTION_ERRORS as e:
+            self._connection_lost.emit() # Disconnect on connection error
+            return f"Verbindungsfehler: {e}"
         except Exception as e:
-            QMessageBox.critical(self, "Fehler", f"Unerwarteter Fehler beim Schalten des Outputs: {e}")
-            button.setChecked(not new_state_on) # Revert button state on unexpected error
+            return f"Unerwarteter Fehler: {e}"
+        return ""
 
-    def _reset_channel(self, channel_id: str):
-        """Setzt den ausgewählten SMU-Kanal zurück."""
+    def _apply_source_settings(self, channel_id: str):
+        """
+        Wendet die eingestellten Source-Parameter an (Button). Gesendet wird im
+        I/O-Thread, die GUI wartet nicht auf das Gerät; Fehler werden als Dialog angezeigt.
+        """
+        if not (self.smu_driver and self.smu_driver.is_open):
+            QMessageBox.critical(self, "Fehler", "SMU ist nicht verbunden.")
+            return
         try:
-            if self.smu_driver and self.smu_driver.is_open:
-                self.smu_driver.reset_channel(channel_id)
-                self.channel_output_state[channel_id] = False
-                btn = self.channel_widgets[channel_id]['output_btn']
-                btn.setChecked(False)
-                btn.setText("OUTPUT ON")
-                self.channel_widgets[channel_id]['v_read_label'].setText("--- V")
-                self.channel_widgets[channel_id]['i_read_label'].setText("--- A")
-                QMessageBox.information(self, "Reset", f"Kanal {channel_id.upper()} wurde zurückgesetzt.")
-            else:
-                QMessageBox.critical(self, "Fehler", "SMU ist nicht verbunden.")
-        except ConnectionError as e:
-            QMessageBox.critical(self, "Verbindungsfehler", f"Fehler beim Zurücksetzen des Kanals: {e}")
-            self._disconnect_smu()
-        except Exception as e:
-            QMessageBox.critical(self, "Fehler", f"Unerwarteter Fehler beim Zurücksetzen: {e}")
+            func, level, limit, sense_mode = self._read_source_inputs(channel_id)
+        except ValueError as e:
+            QMessageBox.critical(self, "Eingabefehler", f"Fehler beim Anwenden der Einstellungen: Ungültige Eingabe: {e}")
+            return
+        # Alle vier Einstellungen in einem Schreibzugriff senden
+        self._submit_io(self.smu_driver.apply_source_settings, channel_id, func, level, limit, sense_mode,
+                        on_done=self._on_source_settings_applied)
+
+    def _on_source_settings_applied(self, future: Future):
+        """Meldet Fehler beim Anwenden der Source-Parameter (GUI-Thread)."""
+        message = self._io_error_message(future)
+        if message:
+            QMessageBox.critical(self, "Fehler", f"Fehler beim Anwenden der Einstellungen: {message}")
+
+    @staticmethod
+    def _switch_output(driver, channel_id: str, on: bool, settings: tuple | None):
+        """
+        Läuft im I/O-Thread: sendet beim Einschalten zuerst die Source-Parameter
+        und schaltet dann den Ausgang. Beide Schritte bilden einen Auftrag, damit
+        kein anderer Befehl dazwischen an das Gerät geht.
+        """
+        if settings is not None:
+            # Unveränderte Einstellungen nicht erneut senden (der Apply-Button sendet immer alles)
+            driver.apply_source_settings(channel_id, *settings, force=False)
+        driver.set_output_state(channel_id, TSP_SMU_ON if on else TSP_SMU_OFF)
+
+    def _toggle_output(self, channel_id: str):
+        """Schaltet den Ausgang eines SMU-Kanals ein oder aus (Button)."""
+        button = self.channel_widgets[channel_id].output_btn
+        # Button zeigt bis zur Bestätigung durch das Gerät den tatsächlichen Zustand
+        button.setChecked(self.channel_output_state[channel_id])
+        if not (self.smu_driver and self.smu_driver.is_open):
+            QMessageBox.critical(self, "Fehler", "Fehler beim Schalten des Outputs: SMU ist nicht verbunden.")
+            return
+        new_state_on = not self.channel_output_state[channel_id] # Desired state
+        settings = None
+        if new_state_on:
+            try:
+                func, level, limit, sense_mode = self._read_source_inputs(channel_id)
+            except ValueError as e:
+                QMessageBox.critical(self, "Fehler", f"Fehler beim Schalten des Outputs: Ungültige Eingabe: {e}")
+                return
+            settings = (func, level, limit, sense_mode)
+        button.setEnabled(False) # Keine zweite Umschaltung, solange diese noch läuft
+        self._submit_io(self._switch_output, self.smu_driver, channel_id, new_state_on, settings,
+                        on_done=lambda future: self._on_output_switched(channel_id, new_state_on, future))
+
+    def _on_output_switched(self, channel_id: str, on: bool, future: Future):
+        """Übernimmt den neuen Ausgangszustand in Button und Status (GUI-Thread)."""
+        message = self._io_error_message(future)
+        button = self.channel_widgets[channel_id].output_btn
+        if self.smu_driver is not None: # Nach einem Trennen bleibt der Kanal deaktiviert
+            button.setEnabled(True)
+        if message:
+            QMessageBox.critical(self, "Fehler", f"Fehler beim Schalten des Outputs: {message}")
+            return
+        if self.smu_driver is None:
+            return # Inzwischen getrennt, _disconnect_smu hat den Button bereits zurückgesetzt
+        button.setText("OUTPUT OFF" if on else "OUTPUT ON")
+        button.setChecked(on)
+        self.channel_output_state[channel_id] = on
+
+    def _reset_channel(self, channel_id: str):
+        """Setzt den ausgewählten SMU-Kanal zurück (Auftrag im I/O-Thread)."""
+        if not (self.smu_driver and self.smu_driver.is_open):
+            QMessageBox.critical(self, "Fehler", "SMU ist nicht verbunden.")
+            return
+        self._submit_io(self.smu_driver.reset_channel, channel_id,
+                        on_done=lambda future: self._on_channel_reset(channel_id, future))
+
+    def _on_channel_reset(self, channel_id: str, future: Future):
+        """Setzt nach erfolgreichem Reset Button und Anzeigen des Kanals zurück (GUI-Thread)."""
+        message = self._io_error_message(future)
+        if message:
+            QMessageBox.critical(self, "Fehler", f"Fehler beim Zurücksetzen des Kanals: {message}")
+            return
+        self.channel_output_state[channel_id] = False
+        widgets = self.channel_widgets[channel_id]
+        btn = widgets.output_btn
+        btn.setChecked(False)
+        btn.setText("OUTPUT ON")
+        self._clear_readings(widgets)
+        # Erfolgsmeldung nicht-modal über den InfoManager (Regel 5.3), Popups nur bei Fehlern
+        self.shared_data.info_manager.status(
+            self.shared_data.info_manager.INFO,
+            f"SMU: Kanal {channel_id.upper()} wurde zurückgesetzt."
+        )
 
     def _measure_iv(self, channel_id: str):
-        """Führt eine I/V-Messung für den ausgewählten SMU-Kanal durch."""
+        """
+        Führt eine I/V-Messung für den ausgewählten SMU-Kanal durch. Die Messung
+        läuft im I/O-Thread; das Ergebnis zeigt _on_measure_done an.
+        """
+        if not (self.smu_driver and self.smu_driver.is_open):
+            QMessageBox.critical(self, "Fehler", "SMU ist nicht verbunden.")
+            return
+        self._submit_io(self.smu_driver.measure_iv, channel_id,
+                        on_done=lambda future: self._on_measure_done(channel_id, future))
+
+    def _on_measure_done(self, channel_id: str, future: Future):
+        """Zeigt das Ergebnis einer I/V-Messung an (läuft im GUI-Thread)."""
+        if self.smu_driver is None:
+            return # Inzwischen getrennt, Ergebnis verwerfen
         try:
-            if self.smu_driver and self.smu_driver.is_open:
-                current, voltage = self.smu_driver.measure_iv(channel_id)
-                self.channel_widgets[channel_id]['i_read_label'].setText(f"{current:.4e} A")
-                self.channel_widgets[channel_id]['v_read_label'].setText(f"{voltage:.4e} V")
-            else:
-                QMessageBox.critical(self, "Fehler", "SMU ist nicht verbunden.")
-        except (ValueError, ConnectionError) as e:
+            current, voltage = future.result()
+            self._show_readings(self.channel_widgets[channel_id], current, voltage)
+        except (ValueError, *CONNECTION_ERRORS) as e:
             QMessageBox.warning(self, "Messfehler", f"I/V-Messung fehlgeschlagen: {e}")
-            if isinstance(e, ConnectionError):
-                self._disconnect_smu() # Disconnect on connection error
+            if isinstance(e, CONNECTION_ERRORS):
+                self._connection_lost.emit() # Disconnect on connection error
         except Exception as e:
             QMessageBox.critical(self, "Fehler", f"Unerwarteter Fehler bei der Messung: {e}")
 
-    def apply_and_measure(self, channel: str, is_voltage_source: bool, level: float, limit: float) -> tuple[float, float] | None:
+    @accepts_is_voltage_source
+    def apply_and_measure(self, channel: str, mode: SourceMode, level: float, limit: float,
+                          settle_time: float = DEFAULT_SETTLE_TIME_S, defer_ui: bool = False) -> tuple[float, float] | None:
         """
         High-Level-API-Methode (Regel 2.2): Setzt einen Wert auf dem SMU, schaltet den Ausgang kurz an,
         misst Strom und Spannung und schaltet den Ausgang wieder aus.
+        Nach waitcomplete() wartet das Gerät settle_time (in s, Standard DEFAULT_SETTLE_TIME_S)
+        vor der Messung; mit settle_time=0 wird gemessen, sobald das Gerät bereit ist.
+        Aus jedem Thread aufrufbar; das Kanal-UI wird immer im GUI-Thread aktualisiert.
+        Mit defer_ui=True (z.B. für Sweeps aus einem Worker-Thread) wird das Kanal-UI nicht
+        sofort aktualisiert; die Werte werden gepuffert und erst mit flush_deferred_ui angezeigt.
+        mode ist ein SourceMode (other/source_mode.py); is_voltage_source=... wird als
+        veralteter Alias weiterhin angenommen.
         Gibt (Strom, Spannung) oder None bei Fehler zurück.
         """
-        if self.shared_data.smu_device is None or not self.shared_data.smu_device.is_open:
+        smu = self.shared_data.smu_device # Get the active SMU driver instance (einmal nachschlagen)
+        if smu is None or not smu.is_open:
             # Do not use QMessageBox here, as this method might be called from non-UI threads
             # or in automated processes where a pop-up is undesirable. Log instead.
-            self._update_serial_log("SMU nicht verbunden für apply_and_measure.")
+            self._logger.warning("SMU nicht verbunden für apply_and_measure.")
             return None
 
-        smu = self.shared_data.smu_device # Get the active SMU driver instance
-
         try:
-            # 1. Apply settings
-            func = TSP_DC_VOLTS if is_voltage_source else TSP_DC_AMPS
-            smu.set_source_function(channel, func)
-            smu.set_source_level(channel, func, level)
-            smu.set_source_limit(channel, func, limit)
-
-            # 2. Turn output on, measure, turn output off
-            smu.set_output_state(channel, TSP_SMU_ON)
-            time.sleep(0.1) # Short delay for stable readings
-            current, voltage = smu.measure_iv(channel)
-            smu.set_output_state(channel, TSP_SMU_OFF)
-
-            # Optional: Update the GUI of the SMU tab for the current channel
-            # This is specific to the UI, so it stays here.
-            widgets = self.channel_widgets.get(channel)
-            if widgets:
-                widgets['level_input'].setText(str(level))
-                widgets['limit_input'].setText(str(limit))
-                widgets['i_read_label'].setText(f"{current:.4e} A")
-                widgets['v_read_label'].setText(f"{voltage:.4e} V")
-                # Also ensure the output button is correctly reflected as OFF
-                widgets['output_btn'].setChecked(False)
-                widgets['output_btn'].setText("OUTPUT ON")
-                self.channel_output_state[channel] = False
-
+            # Settings anwenden, Ausgang ein, messen, Ausgang aus – alles in einem
+            # Schreibzugriff, damit nur ein serieller Round-Trip anfällt
+            func = SOURCE_FUNCS[mode]
+            current, voltage = self._call_io(self._apply_and_measure_retry, smu, channel, func, level, limit, settle_time)
+            self._record_apply_result(channel, level, limit, current, voltage, defer_ui)
             return current, voltage
 
-        except (ValueError, ConnectionError) as e:
+        except (ValueError, *CONNECTION_ERRORS) as e:
             # Log the error, but don't show QMessageBox for an API call
-            self._update_serial_log(f"Fehler in apply_and_measure für Kanal {channel.upper()}: {e}")
-            # If a connection error occurs during an API call, trigger a disconnect
-            if isinstance(e, ConnectionError):
-                self._disconnect_smu()
+            self._report_api_error(f"Fehler in apply_and_measure für Kanal {channel.upper()}: {e}")
+            # If a connection error occurs during an API call, trigger a disconnect (im GUI-Thread)
+            if isinstance(e, CONNECTION_ERRORS):
+                self._connection_lost.emit()
             return None
         except Exception as e:
-            self._update_serial_log(f"Unerwarteter Fehler in apply_and_measure für Kanal {channel.upper()}: {e}")
+            self._report_api_error(f"Unerwarteter Fehler in apply_and_measure für Kanal {channel.upper()}: {e}")
             return None
 
+    @accepts_is_voltage_source
+    def apply_and_measure_async(self, channel: str, mode: SourceMode, level: float, limit: float,
+                                settle_time: float = DEFAULT_SETTLE_TIME_S) -> Future:
+        """
+        Nicht blockierende Variante von apply_and_measure: Der Setzen-Messen-Zyklus
+        wird im I/O-Thread eingereiht und die Methode kehrt sofort zurück.
+        Das Kanal-UI wird nach Abschluss im GUI-Thread aktualisiert.
+
+        Returns:
+            Future: Liefert (Strom, Spannung) bzw. löst die Exception des Treibers aus
+                    (ConnectionError, wenn das SMU nicht verbunden ist). Mehrere Futures
+                    lassen sich z.B. mit concurrent.futures.wait/as_completed kombinieren.
+        """
+        smu = self.shared_data.smu_device
+        if smu is None or not smu.is_open:
+            self._logger.warning("SMU nicht verbunden für apply_and_measure_async.")
+            future = Future()
+            future.set_exception(ConnectionError("SMU nicht verbunden."))
+            return future
+
+        func = SOURCE_FUNCS[mode]
+        return self._submit_io(
+            self._apply_and_measure_retry, smu, channel, func, level, limit, settle_time,
+            on_done=lambda future: self._on_apply_measure_done(channel, level, limit, future)
+        )
+
+    def _apply_and_measure_retry(self, smu, channel: str, func: str, level: float, limit: float,
+                                 settle_time: float) -> tuple[float, float]:
+        """
+        Führt apply_and_measure_atomic im I/O-Thread aus und wiederholt den Zyklus
+        bis zu self.apply_retries Mal, wenn keine gültige Antwort kam (ValueError,
+        z.B. eine verlorene Zeile). Vor jedem neuen Versuch wird mit wachsender
+        Pause gewartet, eine verspätete Antwort verworfen und alle Einstellungen
+        erneut gesendet. Verbindungsfehler werden sofort weitergereicht.
+        """
+        for attempt in range(self.apply_retries + 1):
+            try:
+                return smu.apply_and_measure_atomic(channel, func, level, limit, settle_time, force=attempt > 0)
+            except ValueError as e:
+                if attempt == self.apply_retries:
+                    raise
+                self._logger.warning(f"Kanal {channel.upper()}: {e} – neuer Versuch.")
+                time.sleep(APPLY_RETRY_BACKOFF_S * 2 ** attempt)
+                smu.discard_input()
+
+    def _on_apply_measure_done(self, channel: str, level: float, limit: float, future: Future):
+        """Zeigt das Ergebnis von apply_and_measure_async an (läuft im GUI-Thread)."""
+        try:
+            current, voltage = future.result()
+        except (ValueError, *CONNECTION_ERRORS) as e:
+            self._report_api_error(f"Fehler in apply_and_measure_async für Kanal {channel.upper()}: {e}")
+            if isinstance(e, CONNECTION_ERRORS):
+                self._connection_lost.emit()
+            return
+        except Exception as e:
+            self._report_api_error(f"Unerwarteter Fehler in apply_and_measure_async für Kanal {channel.upper()}: {e}")
+            return
+        if self.smu_driver is not None: # Nach dem Trennen sind die Anzeigen bereits zurückgesetzt
+            self._show_apply_result(channel, level, limit, current, voltage)
+
+    def _start_io_thread(self):
+        """Startet den I/O-Thread und verschiebt den verbundenen Treiber dorthin."""
+        thread = QThread(self)
+        self._io_worker = _SmuIoWorker()
+        self._io_worker.moveToThread(thread)
+        self.smu_driver.moveToThread(thread)
+        self._io_job.connect(self._io_worker.run_job)
+        thread.finished.connect(self._io_worker.deleteLater)
+        thread.start()
+        with self._io_lock:
+            self._io_thread = thread
+
+    def _stop_io_thread(self):
+        """
+        Beendet den I/O-Thread. Aufträge, die noch in der Warteschlange stehen,
+        werden nicht mehr ausgeführt; ihre Futures enden mit einem ConnectionError,
+        damit niemand unbegrenzt auf sie wartet.
+        """
+        with self._io_lock:
+            thread = self._io_thread
+            if thread is None:
+                return
+            self._io_thread = None # Neue Aufträge laufen ab hier direkt (siehe _submit_io)
+            self._io_job.disconnect(self._io_worker.run_job)
+            pending = list(self._io_pending)
+            self._io_pending.clear()
+        thread.quit()
+        thread.wait()
+        thread.deleteLater()
+        self._io_worker = None
+        for future in pending:
+            # Nach wait() läuft kein Auftrag mehr; offen sind nur nie gestartete
+            if not future.done() and future.set_running_or_notify_cancel():
+                future.set_exception(ConnectionError("SMU getrennt, Auftrag wurde nicht ausgeführt."))
+
+    def _submit_io(self, fn, *args, on_done=None) -> Future:
+        """
+        Reiht einen Treiberaufruf im I/O-Thread ein (aus jedem Thread aufrufbar).
+
+        Args:
+            fn: Aufzurufende Treiberfunktion.
+            *args: Argumente für fn.
+            on_done: Optionaler Rückruf mit dem Future, wird im GUI-Thread ausgeführt.
+
+        Returns:
+            Future: Liefert das Ergebnis von fn bzw. löst dessen Exception aus.
+        """
+        future = Future()
+        if on_done is not None:
+            future.add_done_callback(lambda f: self._io_done.emit(f, on_done))
+        job = (future, fn, args)
+        with self._io_lock:
+            queued = self._io_thread is not None
+            if queued:
+                self._io_pending.add(future)
+                future.add_done_callback(self._forget_io_job)
+                self._io_job.emit(job)
+        if not queued:
+            # Kein I/O-Thread (z.B. Verbindungsaufbau fehlgeschlagen oder getrennt): direkt ausführen
+            _run_io_job(job)
+        return future
+
+    def _forget_io_job(self, future: Future):
+        """Entfernt einen abgeschlossenen Auftrag aus der Menge der offenen Aufträge."""
+        with self._io_lock:
+            self._io_pending.discard(future)
+
+    def _call_io(self, fn, *args, timeout: float = IO_CALL_TIMEOUT_S):
+        """
+        Führt einen Treiberaufruf im I/O-Thread aus und wartet auf das Ergebnis.
+
+        Raises:
+            ConnectionError: Wenn der Auftrag nicht innerhalb von timeout Sekunden
+                             abgeschlossen wurde (oder die Verbindung getrennt wurde).
+        """
+        if self._io_thread is not None and QThread.currentThread() is self._io_thread:
+            return fn(*args) # Bereits im I/O-Thread, Warten würde blockieren
+        future = self._submit_io(fn, *args)
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            if future.done():
+                raise # TimeoutError aus dem Auftrag selbst
+            future.cancel() # Falls er noch in der Warteschlange steht
+            raise ConnectionError(f"SMU-Auftrag nicht innerhalb von {timeout:g} s abgeschlossen.") from None
+
+    @pyqtSlot(object, object)
+    def _on_io_done(self, future: Future, callback):
+        """Führt den Rückruf eines abgeschlossenen I/O-Auftrags im GUI-Thread aus."""
+        callback(future)
+
+    def _report_api_error(self, message: str):
+        """
+        Meldet einen Fehler der High-Level-API ohne Popup: Eintrag im seriellen Log
+        und nicht-modale Statusmeldung über den InfoManager. Eine laufende Messschleife
+        wartet so nicht auf eine Bestätigung durch den Benutzer.
+        """
+        self._logger.error(message)
+        self._api_error.emit(message)
+
+    def _show_api_error(self, message: str):
+        """Zeigt eine Fehlermeldung der High-Level-API in der Statusleiste an."""
+        self.shared_data.info_manager.status(self.shared_data.info_manager.ERROR, message)
+
+    def _on_connection_lost(self):
+        """Trennt nach einem Verbindungsfehler (läuft immer im GUI-Thread)."""
+        if self.smu_driver is not None: # Evtl. schon durch eine frühere Meldung getrennt
+            self._disconnect_smu()
+
+    def _on_app_quit(self):
+        """
+        Schaltet beim Beenden der Anwendung die Ausgänge ab, stoppt den I/O-Thread,
+        wartet auf eine laufende Port-Suche und beendet den Log-Thread.
+        """
+        if self.smu_driver is not None:
+            self._disconnect_smu()
+        # Ein QThread darf nicht mit dem Tab zerstört werden, solange er noch läuft
+        for thread in self.findChildren(QThread):
+            thread.quit()
+            thread.wait()
+        self._stop_serial_logger()
+
+    @accepts_is_voltage_source
+    def apply_and_measure_batch(self, channel: str, mode: SourceMode, levels, limit: float,
+                                settle_time: float = DEFAULT_SETTLE_TIME_S, defer_ui: bool = False
+                                ) -> tuple[numpy.ndarray, numpy.ndarray] | None:
+        """
+        High-Level-API-Methode: wie apply_and_measure, aber für viele Sollwerte auf
+        einmal (z.B. einen kompletten Sweep ohne Fortschrittsanzeige). Der Dummy-Treiber
+        berechnet alle Punkte vektorisiert, das echte Gerät misst sie nacheinander.
+        Im Kanal-UI wird nur der letzte Punkt angezeigt (mit defer_ui=True erst in
+        flush_deferred_ui).
+        Gibt (Ströme, Spannungen) als Arrays oder None bei Fehler zurück.
+        """
+        smu = self.shared_data.smu_device
+        if smu is None or not smu.is_open:
+            self._logger.warning("SMU nicht verbunden für apply_and_measure_batch.")
+            return None
+
+        try:
+            func = SOURCE_FUNCS[mode]
+            levels = numpy.asarray(levels, dtype=float)
+            timeout = IO_CALL_TIMEOUT_S + levels.size * (SMU_MEASURE_TIMEOUT_S + settle_time)
+            currents, voltages = self._call_io(smu.apply_and_measure_batch, channel, func, levels, limit, settle_time,
+                                               timeout=timeout)
+            if levels.size:
+                self._record_apply_result(channel, float(levels[-1]), limit,
+                                          float(currents[-1]), float(voltages[-1]), defer_ui)
+            return currents, voltages
+        except (ValueError, *CONNECTION_ERRORS) as e:
+            self._report_api_error(f"Fehler in apply_and_measure_batch für Kanal {channel.upper()}: {e}")
+            if isinstance(e, CONNECTION_ERRORS):
+                self._connection_lost.emit() # Trennen im GUI-Thread (Aufruf evtl. aus dem Sweep-Worker)
+            return None
+        except Exception as e:
+            self._report_api_error(f"Unerwarteter Fehler in apply_and_measure_batch für Kanal {channel.upper()}: {e}")
+            return None
+
+    def _record_apply_result(self, channel: str, level: float, limit: float,
+                             current: float, voltage: float, defer_ui: bool):
+        """
+        Zeigt ein Ergebnis an oder hängt es an den Sweep-Puffer an. Die Anzeige läuft
+        über _apply_result_ready: im GUI-Thread sofort, aus einem Worker-Thread
+        zeitversetzt im GUI-Thread (Widgets dürfen nur dort verändert werden).
+        """
+        if not defer_ui:
+            self._apply_result_ready.emit(channel, level, limit, current, voltage)
+            return
+        n = self._sweep_buf_len
+        if n == len(self._sweep_buf_current):
+            # Puffer voll: alle Spalten auf doppelte Größe erweitern
+            new_size = 2 * n
+            for name in ('_sweep_buf_channel', '_sweep_buf_level', '_sweep_buf_limit',
+                         '_sweep_buf_current', '_sweep_buf_voltage'):
+                old = getattr(self, name)
+                grown = numpy.empty(new_size, dtype=old.dtype)
+                grown[:n] = old
+                setattr(self, name, grown)
+        self._sweep_buf_channel[n] = SMU_CHANNELS.index(channel) if channel in SMU_CHANNELS else -1
+        self._sweep_buf_level[n] = level
+        self._sweep_buf_limit[n] = limit
+        self._sweep_buf_current[n] = current
+        self._sweep_buf_voltage[n] = voltage
+        self._sweep_buf_len = n + 1
+
+    def _reset_sweep_buffer(self):
+        """Legt leere Spalten-Puffer für zurückgestellte UI-Updates an."""
+        self._sweep_buf_channel = numpy.empty(SWEEP_BUFFER_INITIAL_SIZE, dtype=numpy.int8)
+        self._sweep_buf_level = numpy.empty(SWEEP_BUFFER_INITIAL_SIZE, dtype=numpy.float64)
+        self._sweep_buf_limit = numpy.empty(SWEEP_BUFFER_INITIAL_SIZE, dtype=numpy.float64)
+        self._sweep_buf_current = numpy.empty(SWEEP_BUFFER_INITIAL_SIZE, dtype=numpy.float64)
+        self._sweep_buf_voltage = numpy.empty(SWEEP_BUFFER_INITIAL_SIZE, dtype=numpy.float64)
+        self._sweep_buf_len = 0
+
+    def flush_deferred_ui(self):
+        """
+        Zeigt die mit defer_ui=True gepufferten Ergebnisse an: pro Kanal wird nur
+        der jeweils letzte Wert in das UI geschrieben. Muss im GUI-Thread
+        aufgerufen werden (z.B. am Ende eines Sweeps) und leert den Puffer.
+        """
+        n = self._sweep_buf_len
+        if n == 0:
+            return
+        channels = self._sweep_buf_channel[:n]
+        for ch_index, channel in enumerate(SMU_CHANNELS):
+            hits = numpy.flatnonzero(channels == ch_index)
+            if hits.size:
+                last = hits[-1]
+                self._show_apply_result(channel,
+                                        float(self._sweep_buf_level[last]),
+                                        float(self._sweep_buf_limit[last]),
+                                        float(self._sweep_buf_current[last]),
+                                        float(self._sweep_buf_voltage[last]))
+        self._reset_sweep_buffer()
+
+    def _show_readings(self, widgets: ChannelWidgets, current: float, voltage: float):
+        """
+        Zeigt Strom und Spannung in den Labels eines Kanals an. Ein Label wird nur
+        neu gesetzt, wenn sich der Wert sichtbar ändert.
+        """
+        if self._reading_changed(widgets.i_last, current):
+            widgets.i_last = current
+            text = _FMT_I(current)
+            if text != widgets.last_i_text:
+                widgets.i_read_label.setText(text)
+                widgets.last_i_text = text
+        if self._reading_changed(widgets.v_last, voltage):
+            widgets.v_last = voltage
+            text = _FMT_V(voltage)
+            if text != widgets.last_v_text:
+                widgets.v_read_label.setText(text)
+                widgets.last_v_text = text
+
+    @staticmethod
+    def _reading_changed(last: float | None, value: float) -> bool:
+        """
+        Prüft, ob sich ein Messwert sichtbar vom zuletzt angezeigten unterscheidet.
+        Verglichen wird mit dem angezeigten Wert, damit kleine Schritte sich nicht unbemerkt aufsummieren.
+        """
+        return last is None or abs(value - last) >= READING_REL_TOLERANCE * max(abs(value), 1e-30)
+
+    def _clear_readings(self, widgets: ChannelWidgets):
+        """Setzt die Messwert-Labels eines Kanals auf den Platzhalter zurück."""
+        widgets.v_read_label.setText("--- V")
+        widgets.i_read_label.setText("--- A")
+        widgets.last_v_text = "--- V"
+        widgets.last_i_text = "--- A"
+        widgets.v_last = None
+        widgets.i_last = None
+
+    @pyqtSlot(str, float, float, float, float)
+    def _show_apply_result(self, channel: str, level: float, limit: float, current: float, voltage: float):
+        """Zeigt Sollwerte und Messergebnis eines apply_and_measure-Aufrufs im Kanal-UI an (nur im GUI-Thread)."""
+        # Optional: Update the GUI of the SMU tab for the current channel
+        # This is specific to the UI, so it stays here.
+        widgets = self.channel_widgets.get(channel)
+        if widgets:
+            # Alle Änderungen am Kanal sammeln und mit einem einzigen Repaint anzeigen
+            group = widgets.group
+            group.setUpdatesEnabled(False)
+            try:
+                widgets.level_input.setText(str(level))
+                widgets.limit_input.setText(str(limit))
+                self._show_readings(widgets, current, voltage)
+                # Also ensure the output button is correctly reflected as OFF
+                with QSignalBlocker(widgets.output_btn):
+                    widgets.output_btn.setChecked(False)
+                widgets.output_btn.setText("OUTPUT ON")
+            finally:
+                group.setUpdatesEnabled(True)
+            self.channel_output_state[channel] = False
+
+    def _init_serial_logger(self):
+        """
+        Richtet das Logging für das serielle Log ein. Aufrufer (auch Worker-Threads)
+        legen nur einen LogRecord in eine Queue; Zeitstempel-Formatierung und
+        Weitergabe an das Widget erledigt ein QueueListener in einem eigenen Thread.
+        """
+        self._log_queue = queue.Queue()
+        self._logger = logging.getLogger("el_workbench.smu.serial")
+        self._logger.setLevel(logging.INFO)
+        self._logger.propagate = False # Nicht zusätzlich im Root-Logger ausgeben
+        self._logger.handlers = [logging.handlers.QueueHandler(self._log_queue)]
+
+        signal_handler = _SignalLogHandler(self._log_line_ready)
+        signal_handler.setFormatter(_SerialLogFormatter())
+        self._log_line_ready.connect(self._append_log_slot)
+        self._log_listener = logging.handlers.QueueListener(self._log_queue, signal_handler)
+        self._log_listener.start()
+
+    def _stop_serial_logger(self):
+        """Beendet den QueueListener; bereits eingereihte Zeilen werden vorher noch weitergegeben."""
+        if self._log_listener is not None:
+            self._log_listener.stop()
+            self._log_listener = None
+
     def _update_serial_log(self, message: str):
-        """Aktualisiert das serielle Kommunikations-Log."""
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3] # HH:MM:SS.ms
-        log_entry = f"[{timestamp}] {message}"
+        """Slot für die Log-Signale der SMU-Treiber; leitet die Meldung an den Logger weiter."""
+        self._logger.info(message)
+
+    @pyqtSlot(str)
+    def _append_log_slot(self, log_entry: str):
+        """
+        Puffert eine Log-Zeile im GUI-Thread; _flush_serial_log schreibt alle
+        gesammelten Zeilen nach SERIAL_LOG_FLUSH_MS in einem Schritt.
+        """
+        self._log_buffer.append(log_entry)
 
-        # Check if the scrollbar is at the bottom before appending
-        # This ensures auto-scrolling only if the user hasn't scrolled up
-        scrollbar = self.serial_log_textedit.verticalScrollBar()
-        should_scroll = scrollbar.value() == scrollbar.maximum()
+        # Ist der Tab nicht sichtbar, bleiben die Zeilen im Puffer, bis showEvent sie anzeigt
+        if not self._log_flush_pending and self.serial_log_textedit.isVisible():
+            self._log_flush_pending = True
+            QTimer.singleShot(SERIAL_LOG_FLUSH_MS, self._flush_serial_log)
 
-        self.serial_log_textedit.append(log_entry)
+    def _flush_serial_log(self):
+        """Schreibt alle gepufferten Log-Zeilen mit einem einzigen Aufruf in das Widget."""
+        self._log_flush_pending = False
+        if not self._log_buffer or not self.serial_log_textedit.isVisible():
+            return
+        chunk = "\n".join(self._log_buffer)
+        self._log_buffer.clear()
 
-        if should_scroll:
-            self.serial_log_textedit.verticalScrollBar().setValue(self.serial_log_textedit.verticalScrollBar().maximum())
\ No newline at end of file
+        # Einfügen und Scrollen ohne Zwischen-Repaint; gezeichnet wird einmal am Ende
+        self.serial_log_textedit.setUpdatesEnabled(False)
+        try:
+            self.serial_log_textedit.appendPlainText(chunk)
+
+            # Auto-scroll only if the user hasn't scrolled up
+            if self._log_sticky_bottom:
+                scrollbar = self.serial_log_textedit.verticalScrollBar()
+                scrollbar.setValue(scrollbar.maximum())
+        finally:
+            self.serial_log_textedit.setUpdatesEnabled(True)
+
+    def _on_log_scrolled(self, value: int):
+        """Merkt sich, ob das Log am unteren Ende steht (dann wird automatisch mitgescrollt)."""
+        self._log_sticky_bottom = value == self.serial_log_textedit.verticalScrollBar().maximum()
+
+    def showEvent(self, event):
+        """Zeigt beim Wechsel auf diesen Tab die im Hintergrund gepufferten Log-Zeilen an."""
+        super().showEvent(event)
+        if self._log_buffer and not self._log_flush_pending:
+            self._log_flush_pending = True
+            QTimer.singleShot(0, self._flush_serial_log)
@@ -6,7 +6,7 @@
  File:          spectrum_tab.py
  Author:        Silas Hörz
  Creation date: 2025-06-25
- Last modified: 2025-07-25 (Adapted to new API-centric design rules)
+ Last modified: 2026-10-16
  Version:       2.0.0
 ============================================================================
  Description:
@@ -30,18 +30,31 @@
                  shared_data.current_wavelengths/current_intensities for clarity.
                - Emphasized direct SharedState attribute use for live measurement data
                  as per Design Rule 1.4 (transient data).
+ - 2026-10-16: Performance-Überarbeitung:
+               - Gerätesuche in einem Hintergrund-Thread, begrenzt auf
+                 einen Suchlauf pro DEVICE_SCAN_MIN_INTERVAL_S; der Thread
+                 wird beim Beenden der Anwendung abgewartet.
+               - Plot per Blitting, nur y-Daten aktualisiert, Zeichenrate
+                 unabhängig von der Integrationszeit begrenzt, kein
+                 Zeichnen bei verborgenem Tab.
+               - Präziser Mess-Timer, der Änderungen der Integrationszeit folgt.
+               - Dummy-Spektrum in float32 mit vorberechneten Peaks und
+                 wiederverwendeten Puffern.
+               - Status-Log auf 500 Zeilen begrenzt, Zeitstempel einmal
+                 pro Sekunde formatiert.
 ============================================================================
 """
 
+import math
 import numpy as np
 import matplotlib.pyplot as plt
-import datetime # For timestamps in the log
+import time # For timestamps in the log
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QPushButton, QLabel, QComboBox, QHBoxLayout,
-    QSpinBox, QMessageBox, QTextEdit, QSizePolicy, QCheckBox
+    QSpinBox, QMessageBox, QTextEdit, QSizePolicy, QCheckBox, QApplication
 )
-from PyQt6.QtCore import QTimer, Qt, QEvent
+from PyQt6.QtCore import QTimer, Qt, QEvent, QObject, QThread, pyqtSignal
 
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 
@@ -49,6 +62,33 @@ import seabreeze
 seabreeze.use('cseabreeze')
 from seabreeze.spectrometers import Spectrometer, list_devices
 
+# Mindestabstand zwischen zwei Plot-Aktualisierungen (ms). Bei kürzeren
+# Integrationszeiten wird weiter jedes Spektrum gemessen, aber nur jedes n-te gezeichnet.
+SPECTRUM_PLOT_INTERVAL_MS = 50
+# Maximale Zeilenzahl im Status-Log; ältere Zeilen werden automatisch verworfen
+STATUS_LOG_MAX_LINES = 500
+# Mindestabstand zwischen zwei USB-Gerätesuchen beim Öffnen der Geräteauswahl (s)
+DEVICE_SCAN_MIN_INTERVAL_S = 2.0
+
+
+class _DeviceScanWorker(QObject):
+    """
+    Sucht die angeschlossenen Spektrometer in einem eigenen Thread.
+    list_devices() durchsucht den USB-Bus und kann spürbar dauern; im GUI-Thread
+    würde das Öffnen der Geräteauswahl sonst einfrieren.
+    """
+    finished = pyqtSignal(list) # Liste der gefundenen Seabreeze-Geräte
+    failed = pyqtSignal(str)    # Fehlermeldung, falls die Suche fehlschlägt
+
+    def run(self):
+        try:
+            devices = list(list_devices())
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.finished.emit(devices)
+
+
 class SpectrumTab(QWidget):
     """
     Ein QWidget-Tab zur Steuerung und Anzeige von Spektrometerdaten.
@@ -67,13 +107,30 @@ class SpectrumTab(QWidget):
 
         self.shared_data = shared_data
         self.devices = [] # Liste der gefundenen Seabreeze-Geräte
+        self._last_device_scan = None # time.monotonic() der letzten Gerätesuche
+        self._enum_pending = False # Läuft gerade eine Gerätesuche im Hintergrund?
         self.integration_time_ms = 100 # Standard-Integrationszeit
+        self._log_ts_second = None # Sekunde und Text des zuletzt formatierten Log-Zeitstempels
+        self._log_ts_text = ""
+        self._plot_every = 1 # Nur jedes n-te Spektrum zeichnen (siehe _update_plot_skip)
+        self._frame_counter = 0
+        self._update_plot_skip()
         self.dummy_mode_active = False # Flag für den Dummy-Modus
         self.dummy_noise_strength = 50 # Standard-Rauschstärke für Dummy-Modus
+        self._update_dummy_noise_amplitude()
 
         # --- Feste Wellenlängen für den Dummy-Modus basierend auf echten Daten ---
         # Diese Werte kommen aus dem JSON des NIRQUEST512:
-        self.dummy_wavelengths = np.linspace(903.07996, 2527.059023186984, 512)
+        # float32 reicht für simulierte Counts und halbiert den Speicherverkehr pro Frame
+        self.dummy_wavelengths = np.linspace(903.07996, 2527.059023186984, 512, dtype=np.float32)
+        # Zufallsgenerator und Arbeitspuffer für _generate_dummy_spectrum (werden in jedem Frame überschrieben)
+        self._rng = np.random.default_rng()
+        self._dummy_baseline = np.empty_like(self.dummy_wavelengths)
+        self._dummy_noise = np.empty_like(self.dummy_wavelengths)
+        # Die NIR-Peaks hängen nur von den festen Wellenlängen ab und werden einmal berechnet
+        self._dummy_static_peaks = self._compute_dummy_peaks(self.dummy_wavelengths)
+        # Wellenlängen des verbundenen Geräts (feste Kalibrierung, einmal pro Verbindung abgefragt)
+        self._device_wavelengths = None
         # ----------------------------------------------------------------------
 
         self._init_timer()
@@ -87,9 +144,16 @@ class SpectrumTab(QWidget):
         # Dummy-Checkbox initial aktiviert lassen
         self.dummy_mode_checkbox.setEnabled(True)
 
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._on_app_quit)
+
     def _init_timer(self):
         """Initialisiert den QTimer für die Spektrummessung."""
         self.spectrum_timer = QTimer(self)
+        # Präziser Timer: der Standard-Timer (CoarseTimer) darf um bis zu 5 % bzw. unter
+        # Windows ~15 ms abweichen, was bei kurzen Integrationszeiten den Takt verzerrt
+        self.spectrum_timer.setTimerType(Qt.TimerType.PreciseTimer)
         self.spectrum_timer.timeout.connect(self.update_spectrum)
 
     def _init_ui(self):
@@ -162,6 +226,7 @@ class SpectrumTab(QWidget):
         control_layout.addWidget(self.status_log_label)
         self.status_log_textedit = QTextEdit()
         self.status_log_textedit.setReadOnly(True)
+        self.status_log_textedit.document().setMaximumBlockCount(STATUS_LOG_MAX_LINES)
         self.status_log_textedit.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding)
         control_layout.addWidget(self.status_log_textedit)
 
@@ -183,15 +248,71 @@ class SpectrumTab(QWidget):
         self.ax.yaxis.label.set_color('white')
         self.ax.title.set_color('white')
 
+        # Achsen, Gitter und Legende werden nur einmal aufgebaut; pro Messung wird nur
+        # die Linie neu gezeichnet (Blitting). animated=True nimmt die Linie aus dem
+        # normalen Zeichnen heraus, sie wird in _on_canvas_draw separat gezeichnet.
+        self.ax.set_xlabel("Wellenlänge [nm]")
+        self.ax.set_ylabel("Intensität [a.u.]")
+        self.ax.set_title("Live Spektrum (nicht verbunden)")
+        self.ax.grid(True, linestyle='--', alpha=0.6)
+        self.spectrum_line, = self.ax.plot([], [], color='cyan', animated=True, label="Spektrum")
+        self.ax.legend(loc="upper right") # Feste Position: "best" würde bei jedem Neuzeichnen gesucht
+        self.ax.set_xlim(self.dummy_wavelengths[0], self.dummy_wavelengths[-1])
+        self.ax.set_ylim(0, 1)
+        self._plot_background = None # Gespeicherter Hintergrund (alles außer der Linie)
+        self._plot_wavelengths = None # x-Daten der Linie; unverändert wird nur y aktualisiert
+
         self.canvas = FigureCanvas(self.figure)
+        # Nach jedem vollständigen Zeichnen (auch bei Größenänderung) Hintergrund neu sichern
+        self.canvas.mpl_connect('draw_event', self._on_canvas_draw)
         plot_layout.addWidget(self.canvas)
 
         return plot_widget
 
+    def _on_canvas_draw(self, event):
+        """Sichert nach einem vollständigen Zeichnen den Hintergrund und zeichnet die Linie darauf."""
+        self._plot_background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self.spectrum_line)
+
+    def _set_plot_title(self, title: str):
+        """Setzt den Plot-Titel; ein vollständiges Neuzeichnen erfolgt nur bei einer Änderung."""
+        if self.ax.get_title() != title:
+            self.ax.set_title(title)
+            self.canvas.draw_idle()
+
+    def _reset_plot(self):
+        """Leert den Plot (z.B. nach dem Trennen des Spektrometers)."""
+        self.spectrum_line.set_data([], [])
+        self._plot_wavelengths = None
+        self.ax.set_title("Live Spektrum (nicht verbunden)")
+        self.canvas.draw_idle()
+
+    def _plot_limits_changed(self, wavelengths, intensities) -> bool:
+        """
+        Passt die Achsengrenzen an, wenn die Daten herausragen oder deutlich kleiner
+        geworden sind (Hysterese, damit nicht bei jedem Rauschen neu skaliert wird).
+        Gibt True zurück, wenn sich eine Grenze geändert hat.
+        """
+        changed = False
+        x_min, x_max = float(wavelengths[0]), float(wavelengths[-1])
+        if self.ax.get_xlim() != (x_min, x_max):
+            self.ax.set_xlim(x_min, x_max)
+            changed = True
+        y_bottom, y_top = self.ax.get_ylim()
+        data_min, data_max = float(np.min(intensities)), float(np.max(intensities))
+        if data_max > y_top or data_max < 0.5 * y_top or data_min < y_bottom:
+            self.ax.set_ylim(min(0.0, data_min * 1.1), max(data_max * 1.1, 1.0))
+            changed = True
+        return changed
+
     def _log_message(self, message, level="INFO"):
         """Schreibt eine Nachricht mit Zeitstempel in das Log-Feld."""
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = f"[{timestamp}] [{level}] {message}"
+        # Zeitstempel nur einmal pro Sekunde formatieren
+        second = int(time.time())
+        if second != self._log_ts_second:
+            self._log_ts_second = second
+            self._log_ts_text = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+        log_entry = f"[{self._log_ts_text}] [{level}] {message}"
         self.status_log_textedit.append(log_entry)
 
     def _set_controls_enabled(self, enabled: bool):
@@ -209,6 +330,7 @@ class SpectrumTab(QWidget):
     def _update_dummy_noise_strength(self, value: int):
         """Aktualisiert die Rauschstärke für den Dummy-Modus."""
         self.dummy_noise_strength = value
+        self._update_dummy_noise_amplitude()
         self._log_message(f"Dummy-Rauschstärke auf {value} gesetzt.")
         # Wenn Messung im Dummy-Modus läuft, sofort aktualisieren
         if self.spectrum_timer.isActive() and self.dummy_mode_active:
@@ -245,12 +367,7 @@ class SpectrumTab(QWidget):
                 self.shared_data.spectrometer_device = None
                 self._log_message("Dummy-Spektrometer getrennt.")
                 # Plot zurücksetzen, da jetzt nichts verbunden ist
-                self.ax.clear()
-                self.ax.set_xlabel("Wellenlänge [nm]")
-                self.ax.set_ylabel("Intensität [a.u.]")
-                self.ax.set_title("Live Spektrum (nicht verbunden)")
-                self.ax.grid(True, linestyle='--', alpha=0.6)
-                self.canvas.draw()
+                self._reset_plot()
 
             # Aktiviere echte Geräteauswahl und aktualisiere
             self.update_devices()
@@ -265,8 +382,11 @@ class SpectrumTab(QWidget):
         Event-Filter, um Aktionen auszuführen, wenn die Combobox geöffnet wird.
         """
         if obj is self.device_combo and event.type() == QEvent.Type.Show:
-            # Nur aktualisieren, wenn nicht im Dummy-Modus
-            if not self.dummy_mode_active:
+            # Nur aktualisieren, wenn nicht im Dummy-Modus und die letzte Suche nicht gerade erst lief
+            # (list_devices() zählt alle USB-Geräte auf und blockiert dabei die GUI)
+            recently_scanned = (self._last_device_scan is not None and
+                                time.monotonic() - self._last_device_scan < DEVICE_SCAN_MIN_INTERVAL_S)
+            if not self.dummy_mode_active and not recently_scanned:
                 self._log_message("Geräteliste wird aktualisiert...")
                 self.update_devices()
             return True # Event wurde behandelt
@@ -281,15 +401,48 @@ class SpectrumTab(QWidget):
             self.connect_button.setEnabled(True) # Immer "verbindbar" im Dummy-Modus
             return
 
-        # Logik für echte Geräte
+        # Echte Geräte: Suche nur anstoßen, die Combobox füllt _on_devices_scanned
+        if self._enum_pending:
+            return # Eine Suche läuft bereits, nicht mehrere Threads stapeln
+        self._enum_pending = True
+
+        self._device_scan_thread = QThread(self) # Parent hält den Thread am Leben, bis deleteLater greift
+        self._device_scan_worker = _DeviceScanWorker()
+        self._device_scan_worker.moveToThread(self._device_scan_thread)
+
+        self._device_scan_thread.started.connect(self._device_scan_worker.run)
+        self._device_scan_worker.finished.connect(self._on_devices_scanned)
+        self._device_scan_worker.failed.connect(self._on_device_scan_failed)
+        for signal in (self._device_scan_worker.finished, self._device_scan_worker.failed):
+            signal.connect(self._device_scan_thread.quit)
+            signal.connect(self._device_scan_worker.deleteLater)
+        self._device_scan_thread.finished.connect(self._device_scan_thread.deleteLater)
+
+        self._device_scan_thread.start()
+
+    def _on_app_quit(self):
+        """Wartet beim Beenden auf eine laufende Gerätesuche (der Thread darf nicht mit dem Tab zerstört werden)."""
+        for thread in self.findChildren(QThread):
+            thread.quit()
+            thread.wait()
+
+    def _on_device_scan_failed(self, message):
+        """Slot: Die Gerätesuche im Hintergrund ist fehlgeschlagen."""
+        self._enum_pending = False
+        self._log_message(f"Geräte konnten nicht geladen werden: {message}", level="ERROR")
+        if not self.dummy_mode_active:
+            self.connect_button.setEnabled(False) # Deaktiviere, wenn Fehler
+
+    def _on_devices_scanned(self, devices):
+        """Slot: Ergebnis der Gerätesuche in die Combobox übernehmen (GUI-Thread)."""
+        self._enum_pending = False
+        self._last_device_scan = time.monotonic()
+        if self.dummy_mode_active:
+            return # Inzwischen in den Dummy-Modus gewechselt, Ergebnis verwerfen
+
+        self.devices = devices
         current_selection_text = self.device_combo.currentText()
         self.device_combo.clear()
-        try:
-            self.devices = list_devices()
-        except Exception as e:
-            self._log_message(f"Geräte konnten nicht geladen werden: {e}", level="ERROR")
-            self.connect_button.setEnabled(False) # Deaktiviere, wenn Fehler
-            return
 
         if not self.devices:
             self.device_combo.addItem("Keine Geräte gefunden")
@@ -352,6 +505,7 @@ class SpectrumTab(QWidget):
                 self.shared_data.spectrometer_device = None
 
             self.shared_data.spectrometer_device = Spectrometer(self.devices[index])
+            self._device_wavelengths = None
             self._log_message(f"Gerät verbunden: {self.shared_data.spectrometer_device.model} ({self.shared_data.spectrometer_device.serial_number})")
             self.connect_button.setText("Trennen")
             self._set_controls_enabled(True)
@@ -413,12 +567,7 @@ class SpectrumTab(QWidget):
             self._log_message("Kein Spektrometer zum Trennen verbunden.", level="WARNING")
 
         # Plot zurücksetzen (unabhängig davon, ob Dummy oder echt)
-        self.ax.clear()
-        self.ax.set_xlabel("Wellenlänge [nm]")
-        self.ax.set_ylabel("Intensität [a.u.]")
-        self.ax.set_title("Live Spektrum (nicht verbunden)")
-        self.ax.grid(True, linestyle='--', alpha=0.6)
-        self.canvas.draw()
+        self._reset_plot()
 
     def set_integration_time(self):
         """Stellt die Integrationszeit des Spektrometers ein."""
@@ -429,6 +578,7 @@ class SpectrumTab(QWidget):
         integration_time_ms = self.integration_spinbox.value()
         if self.dummy_mode_active:
             self.integration_time_ms = integration_time_ms
+            self._on_integration_time_changed()
             self._log_message(f"Integrationszeit (Dummy) auf {integration_time_ms} ms gesetzt.")
             # Wenn Messung im Dummy-Modus läuft, sofort aktualisieren, um Rauschen anzupassen
             if self.spectrum_timer.isActive():
@@ -438,10 +588,22 @@ class SpectrumTab(QWidget):
             try:
                 self.shared_data.spectrometer_device.integration_time_micros(integration_time_ms * 1000)
                 self.integration_time_ms = integration_time_ms
+                self._on_integration_time_changed()
                 self._log_message(f"Integrationszeit auf {integration_time_ms} ms gesetzt.")
             except Exception as e:
                 self._log_message(f"Konnte Integrationszeit nicht setzen: {e}", level="ERROR")
 
+    def _on_integration_time_changed(self):
+        """Passt Messtakt, Plot-Rate und Dummy-Rauschen an eine neue Integrationszeit an."""
+        if self.spectrum_timer.isActive():
+            self.spectrum_timer.setInterval(self.integration_time_ms)
+        self._update_plot_skip()
+        self._update_dummy_noise_amplitude()
+
+    def _update_plot_skip(self):
+        """Berechnet, jedes wievielte Spektrum gezeichnet wird (höchstens alle SPECTRUM_PLOT_INTERVAL_MS)."""
+        self._plot_every = max(1, math.ceil(SPECTRUM_PLOT_INTERVAL_MS / max(self.integration_time_ms, 1)))
+
     def toggle_measurement(self):
         """Startet oder stoppt die kontinuierliche Spektrummessung."""
         if self.spectrum_timer.isActive():
@@ -477,8 +639,11 @@ class SpectrumTab(QWidget):
         else:
             # Echte Spektrometer-Logik
             try:
-                intensities = self.shared_data.spectrometer_device.intensities()
-                wavelengths = self.shared_data.spectrometer_device.wavelengths()
+                device = self.shared_data.spectrometer_device
+                intensities = device.intensities()
+                if self._device_wavelengths is None: # Kalibrierung ändert sich nicht während der Verbindung
+                    self._device_wavelengths = device.wavelengths()
+                wavelengths = self._device_wavelengths
 
                 # Regel 1.4: Direkter Zugriff für flüchtige/temporäre Messdaten ist erlaubt
                 self.shared_data.current_intensities = intensities
@@ -495,15 +660,64 @@ class SpectrumTab(QWidget):
                 self.dummy_noise_spinbox.setEnabled(False) # Rauschstärke-Spinbox deaktivieren
                 return
 
+        # Messdaten sind aktualisiert; gezeichnet wird nur jedes _plot_every-te Spektrum
+        # und nur, wenn der Tab sichtbar ist (shared_data bleibt trotzdem aktuell)
+        draw = self._frame_counter % self._plot_every == 0
+        self._frame_counter += 1
+        if not draw or not self.isVisible():
+            return
+
         # Plot aktualisieren (gemeinsam für Dummy und Echt)
-        self.ax.clear()
-        self.ax.plot(wavelengths, intensities, color='cyan')
-        self.ax.set_xlabel("Wellenlänge [nm]")
-        self.ax.set_ylabel("Intensität [a.u.]")
-        self.ax.set_title("Live Spektrum (Dummy-Modus)" if self.dummy_mode_active else "Live Spektrum")
-        self.ax.grid(True, linestyle='--', alpha=0.6)
-        self.ax.legend(["Spektrum"])
-        self.canvas.draw()
+        if wavelengths is self._plot_wavelengths:
+            self.spectrum_line.set_ydata(intensities) # Nur y neu, x-Pfad bleibt gültig
+        else:
+            self.spectrum_line.set_data(wavelengths, intensities)
+            self._plot_wavelengths = wavelengths
+        self._set_plot_title("Live Spektrum (Dummy-Modus)" if self.dummy_mode_active else "Live Spektrum")
+        limits_changed = self._plot_limits_changed(wavelengths, intensities)
+        if limits_changed or self._plot_background is None:
+            # Achsen haben sich geändert: vollständiges Zeichnen anfordern. Bis dahin wird nicht
+            # geblittet; _on_canvas_draw sichert danach den neuen Hintergrund.
+            self._plot_background = None
+            self.canvas.draw_idle()
+            return
+        # Nur die Linie über den gespeicherten Hintergrund zeichnen
+        self.canvas.restore_region(self._plot_background)
+        self.ax.draw_artist(self.spectrum_line)
+        self.canvas.blit(self.ax.bbox)
+
+    @staticmethod
+    def _compute_dummy_peaks(wavelengths):
+        """Berechnet die Summe der simulierten NIR-Peaks (Gaußkurven) für die gegebenen Wellenlängen."""
+        # Beispiel-Peaks für den NIR-Bereich (Anpassung je nach dem, was du simulieren möchtest)
+        # Typische NIR-Absorptionsbanden können von O-H, C-H, N-H Obertönen und Kombinationsbanden stammen.
+        # Hier einige fiktive, aber plausible Peaks im NIR-Bereich (Amplitude, Mitte, Breite):
+        peaks = np.array([
+            (25000, 1720, 30), # Peak 1: Erste Obertöne von C-H (ca. 1700-1800 nm)
+            (35000, 1450, 40), # Peak 2: Zweite Obertöne von O-H (ca. 1400-1500 nm, Wasserabsorption)
+            (20000, 2350, 50), # Peak 3: C-H Kombinationsbande (ca. 2300-2400 nm)
+            (10000, 2050, 25), # Peak 4: Kleinere Bande (z.B. N-H Obertöne, ca. 2000-2100 nm)
+        ], dtype=float)
+        amplitude, mean, stddev = peaks.T
+        # Normierte Peakformen als Matrix (Punkte x Peaks), gewichtet summiert per Matrix-Vektor-Produkt
+        profiles = np.exp(-0.5 * ((wavelengths[:, None] - mean) / stddev)**2)
+        return (profiles @ amplitude).astype(wavelengths.dtype)
+
+    def _update_dummy_noise_amplitude(self):
+        """
+        Berechnet die Rauschamplitude des Dummy-Spektrums aus Integrationszeit und
+        Rauschstärke. Wird nur bei Änderung dieser Werte aufgerufen, nicht pro Frame.
+        """
+        min_integration_time = 20 # ms (earliest time where noise is high)
+
+        if self.integration_time_ms <= min_integration_time:
+            noise_factor_integration = 1.0 # Max noise at or below min_integration_time
+        else:
+            noise_factor_integration = (min_integration_time / self.integration_time_ms)**0.7
+            noise_factor_integration = max(0.05, noise_factor_integration) # Clamp minimum noise factor
+
+        # Die einstellbare Rauschstärke multipliziert den Rauschfaktor
+        self._dummy_noise_amplitude = self.dummy_noise_strength * noise_factor_integration
 
     def _generate_dummy_spectrum(self):
         """
@@ -512,48 +726,25 @@ class SpectrumTab(QWidget):
         """
         # Verwende die vordefinierten dummy_wavelengths (von 903nm bis 2527nm, 512 Punkte)
         wavelengths = self.dummy_wavelengths
-        num_points = len(wavelengths)
-        intensities = np.zeros(num_points)
 
         # Grundrauschen und Hintergrund (Anpassung für NIR-Spektrum, das oft weniger "dunkel" ist)
-        baseline = 1000 + np.random.rand(num_points) * 500 # Beispiel für eine leicht schwankende Basislinie im NIR
-
-        # Funktion zum Hinzufügen von Gaußschen Peaks
-        def gaussian(x, amplitude, mean, stddev):
-            return amplitude * np.exp(-((x - mean) / stddev)**2 / 2)
+        baseline = self._dummy_baseline # Beispiel für eine leicht schwankende Basislinie im NIR
+        self._rng.random(dtype=baseline.dtype, out=baseline)
+        baseline *= 500
+        baseline += 1000
 
-        # Beispiel-Peaks für den NIR-Bereich (Anpassung je nach dem, was du simulieren möchtest)
-        # Typische NIR-Absorptionsbanden können von O-H, C-H, N-H Obertönen und Kombinationsbanden stammen.
-        # Hier einige fiktive, aber plausible Peaks im NIR-Bereich:
-
-        # Peak 1: Erste Obertöne von C-H (ca. 1700-1800 nm)
-        intensities += gaussian(wavelengths, 25000, 1720, 30)
-        # Peak 2: Zweite Obertöne von O-H (ca. 1400-1500 nm, Wasserabsorption)
-        intensities += gaussian(wavelengths, 35000, 1450, 40)
-        # Peak 3: C-H Kombinationsbande (ca. 2300-2400 nm)
-        intensities += gaussian(wavelengths, 20000, 2350, 50)
-        # Peak 4: Kleinere Bande (z.B. N-H Obertöne, ca. 2000-2100 nm)
-        intensities += gaussian(wavelengths, 10000, 2050, 25)
-
-        # Addiere die Baseline zum Spektrum
-        intensities += baseline
+        # Statische Peaks plus Baseline. Das Ergebnis ist ein neues Array, da andere Tabs
+        # shared_data.current_intensities über den nächsten Frame hinaus halten können.
+        intensities = self._dummy_static_peaks + baseline
 
         # Überlagertes Rauschen basierend auf Integrationszeit und einstellbarer Stärke
-        min_integration_time = 20 # ms (earliest time where noise is high)
-        max_integration_time = 10000 # ms (latest time where noise is low)
-
-        if self.integration_time_ms <= min_integration_time:
-            noise_factor_integration = 1.0 # Max noise at or below min_integration_time
-        else:
-            noise_factor_integration = (min_integration_time / self.integration_time_ms)**0.7
-            noise_factor_integration = max(0.05, noise_factor_integration) # Clamp minimum noise factor
-
-        # Die einstellbare Rauschstärke multipliziert den Rauschfaktor
-        final_noise_amplitude = self.dummy_noise_strength * noise_factor_integration
-        random_noise = np.random.normal(0, final_noise_amplitude, num_points)
-        intensities += random_noise
-
-        # Sicherstellen, dass Intensitäten nicht negativ werden
-        intensities[intensities < 0] = 0
+        # (Amplitude wird in _update_dummy_noise_amplitude bei Änderungen berechnet)
+        noise = self._dummy_noise
+        self._rng.standard_normal(dtype=noise.dtype, out=noise)
+        noise *= self._dummy_noise_amplitude
+        intensities += noise
+
+        # Sicherstellen, dass Intensitäten nicht negativ werden (in-place, ohne Maske)
+        np.maximum(intensities, 0, out=intensities)
 
         return wavelengths, intensities
\ No newline at end of file
@@ -6,7 +6,7 @@
  File:          sweep_tab.py
  Author:        Silas Hörz
  Creation date: 2025-07-11
- Last modified: 2025-07-11
+ Last modified: 2026-10-16
  Version:       1.0.0
 ============================================================================
  Description:
@@ -16,20 +16,104 @@
 ============================================================================
  Change Log:
  - 2025-07-11: Initial version created.
+ - 2026-10-16: Performance-Überarbeitung:
+               - Messung in zeitlich begrenzten Blöcken über
+                 smu_apply_and_measure_batch, unterbrechbare Pause,
+                 Fortschritt nur bei Änderung des Prozentwerts.
+               - Sollwerte per linspace, Messdaten in einer temporären
+                 speichergemappten .npy-Datei (Speichern per Knopf).
+               - Plot auf eigener Figure mit Blitting, gebündelten Punkten
+                 und begrenzter Bildrate; Pfadvereinfachung nur im Sweep-Plot.
+               - Eingabeprüfung pro Feld mit gemeinsamem Validator.
+ - 2026-10-16: SourceMode wird aus other/source_mode.py importiert statt aus
+               dem SMU-Tab (Zugriff auf das SMU nur über SharedData).
 ============================================================================
 """
-import time
+import os
+import shutil
+import tempfile
+import datetime
 import numpy as np
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QMessageBox,
-    QGridLayout, QGroupBox, QLineEdit, QRadioButton, QProgressBar
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QMessageBox,
+    QGridLayout, QGroupBox, QLineEdit, QRadioButton, QProgressBar, QFileDialog
 )
-from PyQt6.QtCore import QObject, QThread, pyqtSignal
-from PyQt6.QtGui import QDoubleValidator
+from PyQt6.QtCore import QObject, QThread, QTimer, QMutex, QWaitCondition, QLocale, pyqtSignal
+from PyQt6.QtGui import QDoubleValidator, QValidator
 
-import matplotlib.pyplot as plt
+import matplotlib
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 
+from other.source_mode import SourceMode
+
+# Basisverzeichnis des Projekts und vorgeschlagener Speicherort für gespeicherte Sweeps (.npy).
+# Während des Sweeps liegen die Daten in einer temporären Datei, die nur beim Speichern
+# dorthin verschoben und sonst beim nächsten Sweep bzw. Programmende gelöscht wird.
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SWEEP_DATA_DIR = os.path.join(BASE_DIR, "data/sweeps")
+# Anzahl neuer Messpunkte, nach der die Sweep-Datei auf die Platte geschrieben wird
+# (zusätzlich einmal am Ende des Sweeps)
+SWEEP_FLUSH_POINTS = 1024
+
+# Mindestabstand zwischen zwei Plot-Aktualisierungen während eines Sweeps (ms).
+# Neue Messpunkte werden gesammelt und gemeinsam gezeichnet (ca. 25 Bilder/s).
+SWEEP_PLOT_INTERVAL_MS = 40
+# Wartezeit zwischen Einschalten und Messen pro Sollwert (s, läuft auf dem Gerät)
+SWEEP_SETTLE_TIME_S = 0.1
+# Ein Block von Sollwerten pro Aufruf von smu_apply_and_measure_batch ist eine blockierende
+# Schleife auf dem Gerät. Die Blockgröße richtet sich deshalb nach der Zeit: Ein Block soll
+# etwa SWEEP_CHUNK_DURATION_S dauern, damit Plot, Fortschritt und Abbruch reaktiv bleiben.
+SWEEP_CHUNK_DURATION_S = 0.5
+# Geschätzte Messdauer pro Punkt zusätzlich zur Wartezeit (s, Integration bei 1 NPLC)
+SWEEP_POINT_OVERHEAD_S = 0.02
+# Obergrenze für die Blockgröße (Sollwerte), auch bei sehr kurzer Wartezeit
+SWEEP_CHUNK_MAX_POINTS = 64
+# Pause zwischen zwei Blöcken (ms); wird bei einem Abbruch sofort beendet
+SWEEP_CHUNK_PAUSE_MS = 50
+
+def sweep_chunk_size(settle_time):
+    """
+    Anzahl der Sollwerte pro Block, sodass ein Block auf dem Gerät etwa
+    SWEEP_CHUNK_DURATION_S dauert (mindestens 1, höchstens SWEEP_CHUNK_MAX_POINTS).
+    """
+    point_time = max(settle_time, 0.0) + SWEEP_POINT_OVERHEAD_S
+    return max(1, min(SWEEP_CHUNK_MAX_POINTS, int(SWEEP_CHUNK_DURATION_S / point_time)))
+
+def sweep_levels(start, end, step):
+    """
+    Liefert die Sollwerte eines Sweeps von start bis einschließlich end.
+    Die Punktzahl wird aus der Schrittweite bestimmt und die Werte per linspace
+    berechnet, damit Start und Ende exakt getroffen werden (np.arange mit
+    end + step erzeugt durch Rundungsfehler gelegentlich einen Punkt zu viel).
+    Die Schrittweite ist damit ein Zielwert; exakt eingehalten wird sie, wenn
+    (end - start) / step ganzzahlig ist. Passt das Vorzeichen von step nicht
+    zur Richtung des Sweeps, ist das Ergebnis leer.
+    """
+    n = int(round((end - start) / step)) + 1
+    if n < 1:
+        return np.empty(0, dtype=np.float64)
+    return np.linspace(start, end, n, dtype=np.float64)
+
+
+# Lange I-V-Kurven beim Rastern vereinfachen: Punkte, die weniger als ein Pixel
+# von der Linie abweichen, werden zusammengefasst, und sehr lange Pfade werden in
+# Stücken an Agg übergeben. Gilt nur für den Sweep-Plot (per rc_context beim
+# Zeichnen), die globalen Einstellungen und andere Figuren bleiben unverändert.
+SWEEP_PLOT_RC = {
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+}
+
+
+class _SweepCanvas(FigureCanvas):
+    """Canvas des Sweep-Plots: zeichnet mit SWEEP_PLOT_RC statt der globalen Matplotlib-Einstellungen."""
+    def draw(self):
+        with matplotlib.rc_context(SWEEP_PLOT_RC):
+            super().draw()
+
+
 # Dies ist der Worker, der die eigentliche Arbeit im Hintergrund erledigt.
 class SweepWorker(QObject):
     # Signale, um mit dem Haupt-Thread (GUI) zu kommunizieren
@@ -43,6 +127,9 @@ class SweepWorker(QObject):
         self.shared_data = shared_data
         self.params = params
         self._is_running = True
+        # Pause zwischen den Blöcken als Wartebedingung, damit stop() sie sofort beenden kann
+        self._mutex = QMutex()
+        self._stop_condition = QWaitCondition()
 
     def run(self):
         """Führt den Sweep durch."""
@@ -51,60 +138,111 @@ class SweepWorker(QObject):
             end = self.params['end']
             step = self.params['step']
             is_voltage_sweep = self.params['is_voltage_sweep']
+            mode = SourceMode.VOLTAGE if is_voltage_sweep else SourceMode.CURRENT
             
-            sweep_points = np.arange(start, end + step, step)
+            sweep_points = sweep_levels(start, end, step)
             total_steps = len(sweep_points)
+            chunk_size = sweep_chunk_size(SWEEP_SETTLE_TIME_S)
+
+            # Häufig genutzte Attribute einmal vor der Schleife nachschlagen
+            apply_and_measure_batch = self.shared_data.smu_apply_and_measure_batch
+            emit_new = self.newData.emit
+            emit_progress = self.progress.emit
 
-            for i, level in enumerate(sweep_points):
+            done = 0
+            last_pct = -1
+            for start_index in range(0, total_steps, chunk_size):
                 if not self._is_running:
                     break # Schleife abbrechen, wenn stop() aufgerufen wurde
 
-                # Die High-Level-Funktion aus dem SMU-Tab aufrufen
-                result = self.shared_data.smu_apply_and_measure(
+                # Einen Block von Sollwerten auf einmal messen: Die Schleife läuft auf der
+                # SMU, statt pro Punkt einen eigenen Round-Trip über den Treiber zu machen
+                chunk = sweep_points[start_index:start_index + chunk_size]
+                result = apply_and_measure_batch(
                     channel='a',
-                    is_voltage_source=is_voltage_sweep,
-                    level=level,
-                    limit=0.1 # Limit sollte hier vielleicht auch einstellbar sein
+                    mode=mode,
+                    levels=chunk,
+                    limit=0.1, # Limit sollte hier vielleicht auch einstellbar sein
+                    settle_time=SWEEP_SETTLE_TIME_S,
+                    defer_ui=True # SMU-Tab erst am Ende aktualisieren (Widgets nur im GUI-Thread)
                 )
                 
                 if result is None:
                     raise ConnectionError("Messung fehlgeschlagen. SMU nicht bereit?")
 
-                current, voltage = result
+                currents, voltages = result
+                # x=V, y=I beim Spannungssweep, sonst x=I, y=V
+                xs, ys = (voltages, currents) if is_voltage_sweep else (currents, voltages)
                 
                 # Daten an die GUI senden
-                if is_voltage_sweep:
-                    self.newData.emit(voltage, current) # x=V, y=I
-                else:
-                    self.newData.emit(current, voltage) # x=I, y=V
+                for x, y in zip(xs.tolist(), ys.tolist()):
+                    emit_new(x, y)
 
-                # Fortschritt senden
-                self.progress.emit(int(((i + 1) / total_steps) * 100))
-                time.sleep(0.05) # Kurze Pause, um die SMU nicht zu überlasten
+                # Fortschritt nur senden, wenn sich der Prozentwert geändert hat
+                done += len(chunk)
+                pct = done * 100 // total_steps # Ganzzahlig: exakt 100 am Ende
+                if pct != last_pct:
+                    emit_progress(pct)
+                    last_pct = pct
+                self._pause(SWEEP_CHUNK_PAUSE_MS) # Kurze Pause zwischen den Blöcken, um die SMU nicht zu überlasten
 
         except Exception as e:
             self.error.emit(f"Fehler während des Sweeps: {e}")
         
         self.finished.emit()
 
+    def _pause(self, ms):
+        """Wartet bis zu ms Millisekunden; ein Aufruf von stop() beendet die Pause sofort."""
+        self._mutex.lock()
+        try:
+            if self._is_running: # stop() kam evtl. schon vor der Pause
+                self._stop_condition.wait(self._mutex, ms)
+        finally:
+            self._mutex.unlock()
+
     def stop(self):
         """Signalisiert dem Worker, die Arbeit zu beenden."""
+        self._mutex.lock()
         self._is_running = False
+        self._stop_condition.wakeAll()
+        self._mutex.unlock()
 
 
 # Dies ist das Haupt-Widget für den Tab
 class SweepTab(QWidget):
+    # Ein Validator für Fließkommazahlen, den alle Eingabefelder gemeinsam nutzen.
+    # Feste C-Locale: Dezimalpunkt wie bei float(), keine Abfrage der System-Locale
+    _VALIDATOR = QDoubleValidator()
+    _VALIDATOR.setLocale(QLocale(QLocale.Language.C))
+
     def __init__(self, shared_data):
         super().__init__()
         self.shared_data = shared_data
         self.is_sweeping = False
         
-        # Daten-Listen für den Plot
-        self.x_data = []
-        self.y_data = []
+        # Messdaten für den Plot: vorab auf die Punktzahl des Sweeps angelegt
+        # (siehe _allocate_sweep_data), gültig sind jeweils die ersten self._n Einträge
+        self._sweep_data = None
+        self.x_data = np.empty(0)
+        self.y_data = np.empty(0)
+        self._n = 0
+        self._sweep_file = None # Temporäre .npy-Datei hinter _sweep_data (None = nur im Arbeitsspeicher)
+        self._flushed_n = 0 # Bis hierhin ist die Datei auf der Platte aktuell
+        # Noch nicht gezeichnete Messpunkte; _flush_plot übernimmt sie gesammelt
+        self._pending_x = []
+        self._pending_y = []
+
+        self._plot_timer = QTimer(self)
+        self._plot_timer.setInterval(SWEEP_PLOT_INTERVAL_MS)
+        self._plot_timer.timeout.connect(self._flush_plot)
         
         self.init_ui()
 
+        # Nicht gespeicherte Sweep-Daten beim Beenden verwerfen
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._discard_sweep_file)
+
     def init_ui(self):
         layout = QHBoxLayout(self)
 
@@ -122,7 +260,7 @@ class SweepTab(QWidget):
         params_layout.addWidget(self.rb_voltage, 0, 0, 1, 2)
         params_layout.addWidget(self.rb_current, 1, 0, 1, 2)
         
-        validator = QDoubleValidator() # Validator für Fließkommazahlen
+        validator = self._VALIDATOR # Gemeinsamer Validator für alle Zahlenfelder
         
         params_layout.addWidget(QLabel("Start:"), 2, 0)
         self.le_start = QLineEdit("-1.0"); self.le_start.setValidator(validator)
@@ -145,11 +283,22 @@ class SweepTab(QWidget):
         self.btn_start_stop = QPushButton("Sweep starten")
         self.btn_start_stop.clicked.connect(self._start_or_stop_sweep)
         control_layout_v.addWidget(self.btn_start_stop)
+
+        self.btn_save = QPushButton("Daten speichern")
+        self.btn_save.setToolTip("Messdaten des letzten Sweeps als .npy speichern (Zeile 0 = x, Zeile 1 = y).\n"
+                                 "Nicht gespeicherte Daten werden beim nächsten Sweep verworfen.")
+        self.btn_save.setEnabled(False)
+        self.btn_save.clicked.connect(self._save_sweep_data)
+        control_layout_v.addWidget(self.btn_save)
         
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
         control_layout_v.addWidget(self.progress_bar)
 
+        # Nicht-modale Statusanzeige (z.B. "Sweep beendet."), wird vom nächsten Sweep überschrieben
+        self.status_label = QLabel("")
+        control_layout_v.addWidget(self.status_label)
+
         control_group.setLayout(control_layout_v)
         controls_layout.addWidget(control_group)
 
@@ -159,9 +308,15 @@ class SweepTab(QWidget):
         # Rechte Seite: Plot
         plot_widget = QWidget()
         plot_layout = QVBoxLayout(plot_widget)
-        self.figure, self.ax = plt.subplots()
-        self.canvas = FigureCanvas(self.figure)
+        # Eigene Figure statt pyplot: keine Registrierung im globalen pyplot-Zustand,
+        # die Figur wird mit dem Tab freigegeben
+        self.figure = Figure()
+        self.ax = self.figure.add_subplot(111)
+        self.canvas = _SweepCanvas(self.figure)
         self._configure_plot()
+        self._set_plot_labels(self.rb_voltage.isChecked())
+        # Nach jedem vollständigen Zeichnen (auch bei Größenänderung) Hintergrund neu sichern
+        self.canvas.mpl_connect('draw_event', self._on_canvas_draw)
         plot_layout.addWidget(self.canvas)
         layout.addWidget(plot_widget, stretch=1)
 
@@ -177,6 +332,31 @@ class SweepTab(QWidget):
         self.ax.title.set_color('white')
         self.ax.grid(True, linestyle='--', alpha=0.6)
 
+        # Die Messkurve wird einmal angelegt und pro Messpunkt nur mit neuen Daten
+        # versehen (Blitting). animated=True nimmt sie aus dem normalen Zeichnen heraus,
+        # sie wird in _on_canvas_draw bzw. _update_plot separat gezeichnet.
+        self.line, = self.ax.plot([], [], 'o-', color='cyan', animated=True)
+        # Während des Sweeps ohne Antialiasing zeichnen (spart Rasterzeit),
+        # am Ende wird die fertige Kurve einmal geglättet gezeichnet
+        self.line.set_antialiased(False)
+        self._plot_background = None # Gespeicherter Hintergrund (alles außer der Kurve)
+
+    def _set_plot_labels(self, is_voltage_sweep):
+        """Setzt Achsenbeschriftung und Titel passend zur Sweep-Art."""
+        if is_voltage_sweep:
+            self.ax.set_xlabel("Spannung (V)")
+            self.ax.set_ylabel("Strom (A)")
+            self.ax.set_title("I-V Kennlinie")
+        else:
+            self.ax.set_xlabel("Strom (A)")
+            self.ax.set_ylabel("Spannung (V)")
+            self.ax.set_title("V-I Kennlinie")
+
+    def _on_canvas_draw(self, event):
+        """Sichert nach einem vollständigen Zeichnen den Hintergrund und zeichnet die Kurve darauf."""
+        self._plot_background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self.line)
+
     def _start_or_stop_sweep(self):
         if self.is_sweeping:
             self._stop_sweep()
@@ -185,16 +365,28 @@ class SweepTab(QWidget):
 
     def _start_sweep(self):
         # 1. Prüfen, ob SMU bereit ist
-        if not self.shared_data.smu_apply_and_measure:
+        if not self.shared_data.smu_apply_and_measure_batch:
             QMessageBox.warning(self, "Fehler", "SMU ist nicht verbunden oder die Steuerungsfunktion ist nicht bereit.")
             return
 
         # 2. Parameter auslesen und validieren
+        texts = []
+        for name, line_edit in (("Start", self.le_start), ("Ende", self.le_end), ("Schrittweite", self.le_step)):
+            text = line_edit.text()
+            # Offensichtlich ungültige Eingaben schon hier abfangen und das Feld benennen
+            state, _, _ = self._VALIDATOR.validate(text, 0)
+            if state != QValidator.State.Acceptable:
+                QMessageBox.warning(self, "Fehler", f"Bitte eine gültige Zahl für '{name}' eingeben.")
+                return
+            texts.append(text)
         try:
+            # Alle drei Felder in einem Aufruf umwandeln
+            values = np.array(texts, dtype=np.float64)
+            start, end, step = values.tolist()
             params = {
-                'start': float(self.le_start.text()),
-                'end': float(self.le_end.text()),
-                'step': float(self.le_step.text()),
+                'start': start,
+                'end': end,
+                'step': step,
                 'is_voltage_sweep': self.rb_voltage.isChecked()
             }
             if params['step'] == 0:
@@ -210,8 +402,15 @@ class SweepTab(QWidget):
         self.btn_start_stop.setText("Sweep abbrechen")
         self.progress_bar.setValue(0)
         self.progress_bar.setVisible(True)
-        self.x_data, self.y_data = [], [] # Alte Daten löschen
-        self._update_plot() # Plot leeren
+        self.btn_save.setEnabled(False)
+        self.status_label.setText("Sweep läuft...")
+        total_steps = len(sweep_levels(params['start'], params['end'], params['step']))
+        self._allocate_sweep_data(total_steps) # Alte Daten verwerfen
+        self._pending_x, self._pending_y = [], []
+        self.line.set_data(self.x_data[:0], self.y_data[:0]) # Plot leeren
+        self.line.set_antialiased(False)
+        self._set_plot_labels(params['is_voltage_sweep'])
+        self.canvas.draw_idle()
 
         # 4. Worker-Thread erstellen und starten
         self.thread = QThread()
@@ -230,6 +429,7 @@ class SweepTab(QWidget):
         self.worker.error.connect(self._on_error)
 
         self.thread.start()
+        self._plot_timer.start()
 
     def _stop_sweep(self):
         if hasattr(self, 'worker'):
@@ -238,18 +438,142 @@ class SweepTab(QWidget):
     def _sweep_finished(self):
         """Wird aufgerufen, wenn der Thread endet (normal oder durch Abbruch)."""
         self.is_sweeping = False
+        self._plot_timer.stop()
+        self._flush_plot() # Restliche Punkte zeichnen
+        if self._sweep_file is not None:
+            self._flush_sweep_file()
+        self.btn_save.setEnabled(self._n > 0)
+        self.line.set_antialiased(True) # Fertige Kurve geglättet neu zeichnen
+        self.canvas.draw_idle()
+        # Letzte Messwerte des Sweeps im SMU-Tab anzeigen (GUI-Thread)
+        if self.shared_data.smu_flush_deferred_ui:
+            self.shared_data.smu_flush_deferred_ui()
         self.btn_start_stop.setText("Sweep starten")
         self.progress_bar.setVisible(False)
         self._set_controls_enabled(True)
-        QMessageBox.information(self, "Info", "Sweep beendet.")
+        self.status_label.setText("Sweep beendet.")
 
     def _on_error(self, message):
         QMessageBox.critical(self, "Sweep-Fehler", message)
         self._stop_sweep()
 
     def _on_new_data(self, x, y):
-        self.x_data.append(x)
-        self.y_data.append(y)
+        # Nur puffern; gezeichnet wird gebündelt im Takt von _plot_timer
+        self._pending_x.append(x)
+        self._pending_y.append(y)
+
+    def _allocate_sweep_data(self, total_steps):
+        """
+        Legt die Messdaten des neuen Sweeps an. Die Werte landen direkt in einer
+        speichergemappten temporären .npy-Datei (Zeile 0 = x, Zeile 1 = y), sodass
+        lange Sweeps kaum Arbeitsspeicher belegen. Die Datei bleibt nur erhalten,
+        wenn der Benutzer sie speichert (_save_sweep_data). Nicht gemessene Punkte
+        (z.B. nach einem Abbruch) sind NaN.
+        """
+        self._discard_sweep_file() # Nicht gespeicherte Daten des vorigen Sweeps verwerfen
+        self._n = 0
+        self._flushed_n = 0
+        self._sweep_data = None
+        if total_steps > 0:
+            path = None
+            try:
+                fd, path = tempfile.mkstemp(prefix="el_workbench_sweep_", suffix=".npy")
+                os.close(fd)
+                self._sweep_data = np.lib.format.open_memmap(path, mode='w+', dtype=np.float64,
+                                                             shape=(2, total_steps))
+                self._sweep_file = path
+            except OSError as e:
+                # Ohne Datei weitermessen, die Daten liegen dann nur im Arbeitsspeicher
+                self.shared_data.info_manager.status(self.shared_data.info_manager.WARNING,
+                                                     f"Temporäre Sweep-Datei konnte nicht angelegt werden: {e}")
+                if path is not None and os.path.exists(path):
+                    os.remove(path)
+        if self._sweep_data is None:
+            self._sweep_data = np.empty((2, total_steps), dtype=np.float64)
+        self._sweep_data.fill(np.nan)
+        self.x_data, self.y_data = self._sweep_data # Zeilen-Views, keine Kopie
+
+    def _flush_sweep_file(self):
+        """Schreibt die bisher gemessenen Punkte in die temporäre Sweep-Datei."""
+        self._sweep_data.flush()
+        self._flushed_n = self._n
+
+    def _release_sweep_file(self):
+        """
+        Übernimmt die Messdaten aus der temporären Datei in den Arbeitsspeicher und
+        gibt die Datei frei (unter Windows Voraussetzung zum Verschieben oder Löschen).
+
+        Returns:
+            str: Pfad der temporären Datei.
+        """
+        path = self._sweep_file
+        self._sweep_file = None
+        self._sweep_data = np.array(self._sweep_data) # Kopie; die letzte memmap-Referenz entfällt
+        self.x_data, self.y_data = self._sweep_data
+        self.line.set_data(self.x_data[:self._n], self.y_data[:self._n])
+        return path
+
+    def _discard_sweep_file(self):
+        """Löscht die temporäre Datei eines nicht gespeicherten Sweeps."""
+        if self._sweep_file is None:
+            return
+        path = self._sweep_file
+        self._sweep_file = None
+        # Alle Verweise auf die memmap lösen, damit die Datei geschlossen wird
+        self._sweep_data = None
+        self.x_data = self.y_data = np.empty(0)
+        self._n = 0
+        self.line.set_data(self.x_data, self.y_data)
+        try:
+            os.remove(path)
+        except OSError:
+            pass # Liegt im temporären Verzeichnis, das System räumt es später auf
+
+    def _save_sweep_data(self):
+        """Speichert die Messdaten des letzten Sweeps an einem vom Benutzer gewählten Ort."""
+        try:
+            os.makedirs(SWEEP_DATA_DIR, exist_ok=True) # Vorgeschlagener Ordner muss für den Dialog existieren
+        except OSError as e:
+            self.shared_data.info_manager.status(self.shared_data.info_manager.WARNING,
+                                                 f"Ordner {SWEEP_DATA_DIR} konnte nicht angelegt werden: {e}")
+        default_path = os.path.join(SWEEP_DATA_DIR,
+                                    datetime.datetime.now().strftime("sweep_%Y-%m-%d_%H-%M-%S.npy"))
+        path, _ = QFileDialog.getSaveFileName(self, "Sweep-Daten speichern", default_path, "NumPy-Daten (*.npy)")
+        if not path:
+            return
+        if not path.endswith(".npy"):
+            path += ".npy"
+        try:
+            if self._sweep_file is not None:
+                # Temporäre Datei an den Zielort verschieben statt die Daten erneut zu schreiben
+                self._flush_sweep_file()
+                temp_path = self._release_sweep_file()
+                try:
+                    shutil.move(temp_path, path)
+                except OSError:
+                    os.remove(temp_path) # Daten liegen jetzt im Arbeitsspeicher, erneutes Speichern per np.save
+                    raise
+            else:
+                np.save(path, self._sweep_data)
+        except OSError as e:
+            QMessageBox.critical(self, "Fehler", f"Sweep-Daten konnten nicht gespeichert werden: {e}")
+            return
+        self.btn_save.setEnabled(False)
+        self.shared_data.info_manager.status(self.shared_data.info_manager.INFO,
+                                             f"Sweep-Daten gespeichert: {path}")
+
+    def _flush_plot(self):
+        """Übernimmt alle seit dem letzten Aufruf eingetroffenen Punkte und zeichnet einmal."""
+        if not self._pending_x:
+            return
+        n, end = self._n, self._n + len(self._pending_x)
+        self.x_data[n:end] = self._pending_x
+        self.y_data[n:end] = self._pending_y
+        self._n = end
+        self._pending_x.clear()
+        self._pending_y.clear()
+        if self._sweep_file is not None and self._n - self._flushed_n >= SWEEP_FLUSH_POINTS:
+            self._flush_sweep_file()
         self._update_plot()
         
     def _set_controls_enabled(self, enabled):
@@ -258,17 +582,24 @@ class SweepTab(QWidget):
             widget.setEnabled(enabled)
 
     def _update_plot(self):
-        self.ax.clear()
-        self._configure_plot()
-        
-        if self.rb_voltage.isChecked():
-            self.ax.set_xlabel("Spannung (V)")
-            self.ax.set_ylabel("Strom (A)")
-            self.ax.set_title("I-V Kennlinie")
-        else:
-            self.ax.set_xlabel("Strom (A)")
-            self.ax.set_ylabel("Spannung (V)")
-            self.ax.set_title("V-I Kennlinie")
-            
-        self.ax.plot(self.x_data, self.y_data, 'o-', color='cyan')
-        self.canvas.draw()
\ No newline at end of file
+        """
+        Zeichnet die Messkurve neu. Solange die Achsengrenzen gleich bleiben, wird nur
+        die Kurve über den gespeicherten Hintergrund geblittet; ändern sie sich, wird
+        die ganze Figur einmal neu gezeichnet (und der Hintergrund dabei neu gesichert).
+        """
+        # Der Pfad der Kurve entsteht bei relim() bzw. draw_artist() und übernimmt
+        # dabei die Vereinfachungs-Einstellungen, daher beides mit SWEEP_PLOT_RC
+        with matplotlib.rc_context(SWEEP_PLOT_RC):
+            self.line.set_data(self.x_data[:self._n], self.y_data[:self._n])
+            old_limits = (self.ax.get_xlim(), self.ax.get_ylim())
+            self.ax.relim()
+            self.ax.autoscale_view()
+
+            if self._plot_background is None or (self.ax.get_xlim(), self.ax.get_ylim()) != old_limits:
+                self._plot_background = None
+                self.canvas.draw_idle()
+                return
+
+            self.canvas.restore_region(self._plot_background)
+            self.ax.draw_artist(self.line)
+        self.canvas.blit(self.ax.bbox)